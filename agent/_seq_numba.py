@@ -0,0 +1,159 @@
+"""
+Optional numba-accelerated kernels for sequence analysis.
+
+Falls back to NumPy implementations when numba is not installed, so the
+analyzer works identically either way — just slower on very long shot
+lists (tens of thousands of shots per capture session).
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Keep compiled kernels in a project-local cache so reuse across
+# interpreter restarts does not depend on a writable HOME
+os.environ.setdefault('NUMBA_CACHE_DIR',
+                      str(Path(__file__).resolve().parent / '.numba_cache'))
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature: the dispatcher skips type inference and the
+    # compiled kernel lands in the on-disk cache at import
+    @njit('int64[:](float64[:], float64)', cache=True)
+    def find_breaks(ts_sorted: np.ndarray, window_sec: float) -> np.ndarray:
+        """
+        Find indices where the gap between consecutive sorted timestamps
+        exceeds the temporal window.
+
+        Single fused pass: no intermediate diff array is allocated.
+
+        Args:
+            ts_sorted: Sorted float64 timestamp array
+            window_sec: Temporal window in seconds
+
+        Returns:
+            int64 array of break indices (suitable for np.split)
+        """
+        out = np.empty(ts_sorted.size, np.int64)
+        n = 0
+        for i in range(1, ts_sorted.size):
+            if ts_sorted[i] - ts_sorted[i - 1] > window_sec:
+                out[n] = i
+                n += 1
+        return out[:n]
+else:
+    def find_breaks(ts_sorted: np.ndarray, window_sec: float) -> np.ndarray:
+        """NumPy fallback for find_breaks when numba is unavailable."""
+        return np.where(np.diff(ts_sorted) > window_sec)[0] + 1
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def cosine_neighbors(X: np.ndarray, eps_sim: float):
+        """
+        Region query for DBSCAN: per-point neighbor lists over normalized
+        float32 embeddings, thresholded on cosine similarity.
+
+        Two parallel passes (count, then fill) produce a compact CSR
+        structure without Python-level dispatch per point.
+
+        Args:
+            X: (N, D) float32 array of L2-normalized embeddings
+            eps_sim: Minimum cosine similarity to count as a neighbor
+
+        Returns:
+            (offsets, indices): int64 offsets of length N+1 and int32
+            neighbor indices, CSR-style (each point includes itself)
+        """
+        n, d = X.shape
+        counts = np.zeros(n, np.int64)
+        for i in prange(n):
+            c = 0
+            for j in range(n):
+                s = 0.0
+                for k in range(d):
+                    s += X[i, k] * X[j, k]
+                if s >= eps_sim:
+                    c += 1
+            counts[i] = c
+
+        offsets = np.zeros(n + 1, np.int64)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + counts[i]
+
+        indices = np.empty(offsets[n], np.int32)
+        for i in prange(n):
+            pos = offsets[i]
+            for j in range(n):
+                s = 0.0
+                for k in range(d):
+                    s += X[i, k] * X[j, k]
+                if s >= eps_sim:
+                    indices[pos] = j
+                    pos += 1
+        return offsets, indices
+else:
+    def cosine_neighbors(X: np.ndarray, eps_sim: float):
+        """NumPy fallback for cosine_neighbors when numba is unavailable."""
+        sim = X @ X.T
+        offsets = np.zeros(X.shape[0] + 1, np.int64)
+        rows = []
+        for i in range(X.shape[0]):
+            neigh = np.where(sim[i] >= eps_sim)[0].astype(np.int32)
+            rows.append(neigh)
+            offsets[i + 1] = offsets[i] + neigh.size
+        return offsets, np.concatenate(rows) if rows else np.empty(0, np.int32)
+
+
+def dbscan_from_neighbors(offsets: np.ndarray,
+                          indices: np.ndarray,
+                          min_samples: int) -> np.ndarray:
+    """
+    DBSCAN cluster expansion over precomputed CSR neighbor lists.
+
+    The expansion is cheap once neighborhoods exist, so plain Python is
+    fine here; the heavy region query lives in cosine_neighbors.
+
+    Args:
+        offsets: int64 CSR offsets (length N+1)
+        indices: int32 CSR neighbor indices
+        min_samples: Minimum neighborhood size (self included) for a
+                     point to be a core point
+
+    Returns:
+        int64 label array; -1 marks noise (same semantics as sklearn)
+    """
+    n = offsets.size - 1
+    labels = np.full(n, -1, np.int64)
+    visited = np.zeros(n, np.bool_)
+    cluster = 0
+
+    for i in range(n):
+        if visited[i]:
+            continue
+        visited[i] = True
+
+        if offsets[i + 1] - offsets[i] < min_samples:
+            continue  # not a core point; stays noise unless claimed later
+
+        labels[i] = cluster
+        seeds = list(indices[offsets[i]:offsets[i + 1]])
+        while seeds:
+            j = seeds.pop()
+            if labels[j] == -1:
+                labels[j] = cluster  # border point
+            if not visited[j]:
+                visited[j] = True
+                if offsets[j + 1] - offsets[j] >= min_samples:
+                    labels[j] = cluster
+                    seeds.extend(indices[offsets[j]:offsets[j + 1]])
+        cluster += 1
+
+    return labels
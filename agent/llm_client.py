@@ -45,6 +45,64 @@ class ClaudeClient:
         """Ensure we have a valid authentication token."""
         if not self.token:
             self.token = get_auth_token()
+
+    @staticmethod
+    def _resolve_workflow_id(workflow_id: Optional[str], module: Optional[str]) -> str:
+        """
+        Resolve the Open Arena workflow ID for a request.
+
+        Args:
+            workflow_id: Explicit workflow ID (wins if provided)
+            module: Optional module name used to look up a module-specific
+                    workflow from the environment
+
+        Returns:
+            Workflow ID string
+
+        Raises:
+            Exception: If no workflow ID can be resolved
+        """
+        if workflow_id:
+            return workflow_id
+
+        import os
+        if module:
+            # Try module-specific workflow ID first
+            module_workflow = os.getenv(f'{module.upper()}_WORKFLOW_ID')
+            if module_workflow:
+                logger.info(f"[CLAUDE] Using {module} workflow: {module_workflow}")
+                return module_workflow
+
+        # Fall back to default workflow
+        default_workflow = os.getenv('WORKFLOW_ID')
+        if not default_workflow:
+            raise Exception("No workflow_id provided and WORKFLOW_ID not set in environment")
+        return default_workflow
+
+    @staticmethod
+    def _extract_content(result: Dict[str, Any]):
+        """
+        Extract answer content from an Open Arena response.
+
+        Open Arena returns a nested structure: result.answer.{node_id}.
+
+        Args:
+            result: Parsed response JSON
+
+        Returns:
+            Content from the first LLM node, or a best-effort fallback
+        """
+        content = None
+        if "result" in result and "answer" in result["result"]:
+            # Get the first answer from any LLM node
+            answers = result["result"]["answer"]
+            if answers:
+                content = next(iter(answers.values()))
+
+        # Fallback to other possible response formats
+        if not content:
+            content = result.get("response") or result.get("answer") or str(result)
+        return content
     
     def chat(self, 
              query: str,
@@ -69,22 +127,9 @@ class ClaudeClient:
             source of truth for all model parameters.
         """
         self._ensure_token()
-        
-        # Use module-specific workflow if module is specified
-        if not workflow_id:
-            import os
-            if module:
-                # Try module-specific workflow ID first
-                workflow_id = os.getenv(f'{module.upper()}_WORKFLOW_ID')
-                if workflow_id:
-                    logger.info(f"[CLAUDE] Using {module} workflow: {workflow_id}")
-            
-            # Fall back to default workflow
-            if not workflow_id:
-                workflow_id = os.getenv('WORKFLOW_ID')
-                if not workflow_id:
-                    raise Exception("No workflow_id provided and WORKFLOW_ID not set in environment")
-        
+
+        workflow_id = self._resolve_workflow_id(workflow_id, module)
+
         # Construct request payload per Open Arena API spec
         # Note: Model parameters (model, temperature, max_tokens, system_prompt) are
         # configured in the workflow itself, not sent in the request
@@ -123,21 +168,9 @@ class ClaudeClient:
             
             response.raise_for_status()
             result = response.json()
-            
-            # Extract content from Open Arena response
-            # Open Arena returns nested structure: result.answer.{node_id}
-            content = None
-            if "result" in result and "answer" in result["result"]:
-                # Get the first answer from any LLM node
-                answers = result["result"]["answer"]
-                if answers:
-                    # Get first answer value
-                    content = next(iter(answers.values()))
-            
-            # Fallback to other possible response formats
-            if not content:
-                content = result.get("response") or result.get("answer") or str(result)
-            
+
+            content = self._extract_content(result)
+
             logger.info(f"[CLAUDE] Response received ({len(str(content))} chars)")
             
             # Log interaction if enabled
@@ -173,6 +206,176 @@ class ClaudeClient:
             logger.error(f"[CLAUDE] API request failed: {e}")
             raise Exception(f"Claude API request failed: {str(e)}")
     
+    def chat_stream(self,
+                    query: str,
+                    workflow_id: Optional[str] = None,
+                    context: Optional[str] = None,
+                    module: Optional[str] = None,
+                    should_stop=None,
+                    chunk_size: int = 1024) -> Dict[str, Any]:
+        """
+        Send an inference request and consume the response as a stream.
+
+        Open Arena has no token-level streaming — the response is one
+        JSON document — but large completions still arrive over the wire
+        in chunks. Callers can pass should_stop(text_so_far) to close the
+        connection as soon as decision-critical content has arrived
+        instead of paying for the full body.
+
+        Args:
+            query: The user query/prompt
+            workflow_id: Optional workflow ID (uses default if not provided)
+            context: Optional context string
+            module: Optional module name ('planner', 'picker', 'verifier')
+            should_stop: Optional predicate on the text received so far;
+                         returning True aborts the download
+            chunk_size: Bytes per streamed chunk
+
+        Returns:
+            Response dictionary with 'content' and 'truncated'. When
+            truncated, 'content' is the raw partial body and no usage
+            information is available.
+        """
+        self._ensure_token()
+
+        workflow_id = self._resolve_workflow_id(workflow_id, module)
+
+        payload = {
+            "workflow_id": workflow_id,
+            "query": query,
+            "is_persistence_allowed": False
+        }
+        if context:
+            payload["context"] = context
+
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        }
+
+        logger.info(f"[CLAUDE] Streaming request to workflow {workflow_id} "
+                    f"({len(query)} chars)")
+
+        try:
+            response = requests.post(
+                f"{self.base_url}/inference",
+                headers=headers,
+                json=payload,
+                timeout=120,
+                stream=True
+            )
+            response.raise_for_status()
+
+            text = ""
+            truncated = False
+            for chunk in response.iter_content(chunk_size=chunk_size,
+                                               decode_unicode=True):
+                if not chunk:
+                    continue
+                if isinstance(chunk, bytes):
+                    chunk = chunk.decode('utf-8', errors='ignore')
+                text += chunk
+                if should_stop is not None and should_stop(text):
+                    truncated = True
+                    response.close()
+                    break
+
+            if truncated:
+                logger.info(f"[CLAUDE] Stream aborted early after "
+                            f"{len(text)} chars")
+                return {
+                    "content": text,
+                    "truncated": True,
+                    "usage": {},
+                    "model": self.model,
+                    "raw_response": None
+                }
+
+            result = json.loads(text)
+            content = self._extract_content(result)
+
+            logger.info(f"[CLAUDE] Response received ({len(str(content))} chars)")
+
+            return {
+                "content": content,
+                "truncated": False,
+                "usage": result.get("usage", {}),
+                "model": result.get("model", self.model),
+                "raw_response": result
+            }
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"[CLAUDE] Streaming API request failed: {e}")
+            raise Exception(f"Claude API request failed: {str(e)}")
+
+    async def achat(self,
+                    query: str,
+                    workflow_id: Optional[str] = None,
+                    context: Optional[str] = None,
+                    module: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of chat() for concurrent inference requests.
+
+        The workload is network-bound, so callers can overlap many
+        in-flight requests with asyncio.gather instead of paying each
+        round trip sequentially.
+
+        Args:
+            query: The user query/prompt
+            workflow_id: Optional workflow ID (uses default if not provided)
+            context: Optional context string
+            module: Optional module name ('planner', 'picker', 'verifier')
+
+        Returns:
+            Response dictionary with 'content', 'usage', etc.
+        """
+        import httpx
+
+        self._ensure_token()
+
+        workflow_id = self._resolve_workflow_id(workflow_id, module)
+
+        payload = {
+            "workflow_id": workflow_id,
+            "query": query,
+            "is_persistence_allowed": False
+        }
+        if context:
+            payload["context"] = context
+
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        }
+
+        logger.info(f"[CLAUDE] Async request to workflow {workflow_id} "
+                    f"({len(query)} chars)")
+
+        try:
+            async with httpx.AsyncClient(timeout=120) as client:
+                response = await client.post(
+                    f"{self.base_url}/inference",
+                    headers=headers,
+                    json=payload
+                )
+                response.raise_for_status()
+                result = response.json()
+
+            content = self._extract_content(result)
+
+            logger.info(f"[CLAUDE] Response received ({len(str(content))} chars)")
+
+            return {
+                "content": content,
+                "usage": result.get("usage", {}),
+                "model": result.get("model", self.model),
+                "raw_response": result
+            }
+
+        except httpx.HTTPError as e:
+            logger.error(f"[CLAUDE] Async API request failed: {e}")
+            raise Exception(f"Claude API request failed: {str(e)}")
+
     def chat_with_json(self,
                       query: str,
                       workflow_id: Optional[str] = None,
@@ -5,7 +5,12 @@ Takes an editorial brief and creates a beat-by-beat story structure.
 Uses LLM to analyze requirements and plan the edit.
 """
 
+import copy
+import hashlib
 import logging
+import shelve
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
 from typing import Dict, List, Optional
 import json
 
@@ -13,30 +18,153 @@ from agent.llm_client import ClaudeClient
 from agent.system_prompts import get_system_prompt
 from agent.working_set import WorkingSetBuilder
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging configuration is the application entrypoint's responsibility
 logger = logging.getLogger(__name__)
 
+# Gemini metadata fields surfaced per shot in the planning context
+_META_FIELDS = (
+    ('gemini_shot_size', 'Size'),
+    ('gemini_camera_movement', 'Movement'),
+    ('gemini_subjects', 'Subjects'),
+    ('gemini_action', 'Action')
+)
+
+
+@dataclass(slots=True)
+class Beat:
+    """A single story beat within a plan."""
+    beat_number: int
+    title: str
+    description: str = ''
+    target_duration: int = 0
+    required_shot_types: List[str] = field(default_factory=list)
+    requirements: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict, beat_number: int, default_duration: int) -> 'Beat':
+        """Build a Beat from an LLM response dict, filling in missing fields."""
+        return cls(
+            beat_number=data.get('beat_number', beat_number),
+            title=data.get('title', f"Beat {beat_number}"),
+            description=data.get('description', ''),
+            target_duration=data.get('target_duration', default_duration),
+            required_shot_types=data.get('required_shot_types', []),
+            requirements=data.get('requirements', [])
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict for external boundaries."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class Plan:
+    """A complete beat-by-beat story plan."""
+    story_slug: str
+    brief: str
+    target_duration: int
+    beats: List[Beat] = field(default_factory=list)
+    raw_response: str = ''
+    fallback: bool = False
+
+    @property
+    def total_beats(self) -> int:
+        return len(self.beats)
+
+    @property
+    def planned_duration(self) -> int:
+        return sum(b.target_duration for b in self.beats)
+
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict for external boundaries."""
+        plan_dict = {
+            'story_slug': self.story_slug,
+            'brief': self.brief,
+            'target_duration': self.target_duration,
+            'beats': [b.to_dict() for b in self.beats],
+            'total_beats': self.total_beats,
+            'planned_duration': self.planned_duration
+        }
+        if self.raw_response:
+            plan_dict['raw_response'] = self.raw_response
+        if self.fallback:
+            plan_dict['fallback'] = True
+        return plan_dict
+
 
 class Planner:
     """Plans story structure from editorial brief."""
     
-    def __init__(self, 
+    def __init__(self,
                  llm_client: ClaudeClient,
-                 working_set_builder: WorkingSetBuilder):
+                 working_set_builder: WorkingSetBuilder,
+                 enable_cache: bool = True,
+                 cache_dir: Optional[str] = None):
         """
         Initialize planner.
-        
+
         Args:
             llm_client: LLM client for inference
             working_set_builder: Working set builder for context
+            enable_cache: Cache plans keyed by (brief, working set fingerprint)
+            cache_dir: Optional directory for a disk-persisted plan cache
+                       (shared across processes/runs); in-memory only if None
         """
         self.llm_client = llm_client
         self.working_set_builder = working_set_builder
+        self.enable_cache = enable_cache
+        self.cache_dir = cache_dir
+        self._plan_cache: Dict[str, Dict] = {}
         logger.info("[PLANNER] Initialized")
+
+    @staticmethod
+    def _plan_cache_key(story_slug: str,
+                        brief: str,
+                        target_duration: int,
+                        working_set: Dict) -> str:
+        """
+        Build a cache key from the brief and a fingerprint of the working set.
+
+        Relevance scores are bucketed to 2 decimal places so tiny float
+        jitter between runs does not defeat the cache.
+        """
+        fingerprint = (
+            story_slug,
+            brief.lower().strip(),
+            target_duration,
+            tuple(sorted(
+                (s['shot_id'], round(s.get('relevance_score', 0), 2))
+                for s in working_set['shots']
+            ))
+        )
+        return hashlib.blake2b(repr(fingerprint).encode()).hexdigest()
+
+    def _get_cached_plan(self, cache_key: str) -> Optional[Dict]:
+        """Look up a plan in the memory cache, then the disk cache."""
+        cached = self._plan_cache.get(cache_key)
+
+        if cached is None and self.cache_dir:
+            try:
+                with shelve.open(str(Path(self.cache_dir) / 'plan_cache')) as db:
+                    cached = db.get(cache_key)
+                if cached is not None:
+                    self._plan_cache[cache_key] = cached
+            except Exception as e:
+                logger.warning("[PLANNER] Disk cache read failed: %s", e)
+
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _store_cached_plan(self, cache_key: str, plan: Dict) -> None:
+        """Store a plan in the memory cache and optional disk cache."""
+        self._plan_cache[cache_key] = copy.deepcopy(plan)
+
+        if self.cache_dir:
+            try:
+                Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+                with shelve.open(str(Path(self.cache_dir) / 'plan_cache')) as db:
+                    db[cache_key] = plan
+            except Exception as e:
+                logger.warning("[PLANNER] Disk cache write failed: %s", e)
     
     def create_plan(self,
                    story_slug: str,
@@ -55,9 +183,9 @@ class Planner:
         Returns:
             Dictionary with plan structure
         """
-        logger.info(f"[PLANNER] Creating plan for story: {story_slug}")
-        logger.info(f"[PLANNER] Brief: {brief}")
-        logger.info(f"[PLANNER] Target duration: {target_duration}s")
+        logger.info("[PLANNER] Creating plan for story: %s", story_slug)
+        logger.info("[PLANNER] Brief: %s", brief)
+        logger.info("[PLANNER] Target duration: %ds", target_duration)
         
         # Step 1: Build working set for context
         logger.info("[PLANNER] Building working set for context...")
@@ -68,9 +196,18 @@ class Planner:
             include_neighbors=True
         )
         
-        logger.info(f"[PLANNER] Working set: {len(working_set['shots'])} shots, "
-                   f"{working_set['total_duration']:.1f}s total")
-        
+        logger.info("[PLANNER] Working set: %d shots, %.1fs total",
+                   len(working_set['shots']), working_set['total_duration'])
+
+        # Check plan cache before paying for an LLM call
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._plan_cache_key(story_slug, brief, target_duration, working_set)
+            cached_plan = self._get_cached_plan(cache_key)
+            if cached_plan is not None:
+                logger.info("[PLANNER] ✓ Plan cache hit (%s...)", cache_key[:12])
+                return cached_plan
+
         # Step 2: Format context for LLM
         context = self._format_planning_context(
             working_set=working_set,
@@ -93,13 +230,18 @@ class Planner:
             
             # Step 4: Parse response
             plan = self._parse_plan_response(response_text, story_slug, brief, target_duration)
-            
-            logger.info(f"[PLANNER] ✓ Plan created with {len(plan['beats'])} beats")
-            
-            return plan
-            
+
+            logger.info("[PLANNER] ✓ Plan created with %d beats", plan.total_beats)
+
+            plan_dict = plan.to_dict()
+
+            if cache_key is not None and not plan.fallback:
+                self._store_cached_plan(cache_key, plan_dict)
+
+            return plan_dict
+
         except Exception as e:
-            logger.error(f"[PLANNER] ✗ Planning failed: {e}")
+            logger.error("[PLANNER] ✗ Planning failed: %s", e)
             raise
     
     def _format_planning_context(self,
@@ -175,19 +317,12 @@ class Planner:
                     lines.append(f"Audio: \"{text}\"")
                 
                 # Include additional Gemini metadata if available
-                metadata_parts = []
-                if shot.get('gemini_shot_size'):
-                    metadata_parts.append(f"Size: {shot['gemini_shot_size']}")
-                if shot.get('gemini_camera_movement'):
-                    metadata_parts.append(f"Movement: {shot['gemini_camera_movement']}")
-                if shot.get('gemini_subjects'):
-                    subjects = shot['gemini_subjects']
-                    if isinstance(subjects, list):
-                        subjects = ', '.join(subjects)
-                    metadata_parts.append(f"Subjects: {subjects}")
-                if shot.get('gemini_action'):
-                    metadata_parts.append(f"Action: {shot['gemini_action']}")
-                
+                metadata_parts = [
+                    f"{label}: {', '.join(value) if isinstance(value, list) else value}"
+                    for key, label in _META_FIELDS
+                    if (value := shot.get(key))
+                ]
+
                 if metadata_parts:
                     lines.append(f"Details: {' | '.join(metadata_parts)}")
                 
@@ -233,18 +368,18 @@ class Planner:
                             response: str,
                             story_slug: str,
                             brief: str,
-                            target_duration: int) -> Dict:
+                            target_duration: int) -> Plan:
         """
         Parse LLM response into structured plan.
-        
+
         Args:
             response: LLM response text
             story_slug: Story identifier
             brief: Original brief
             target_duration: Target duration
-            
+
         Returns:
-            Structured plan dictionary
+            Structured Plan instance
         """
         # Try to extract JSON from response
         try:
@@ -262,106 +397,90 @@ class Planner:
                 json_str = response.strip()
             
             plan_data = json.loads(json_str)
-            
+
             # Validate structure
             if 'beats' not in plan_data:
                 raise ValueError("Response missing 'beats' field")
-            
-            # Build complete plan
-            plan = {
-                'story_slug': story_slug,
-                'brief': brief,
-                'target_duration': target_duration,
-                'beats': plan_data['beats'],
-                'total_beats': len(plan_data['beats']),
-                'planned_duration': sum(b.get('target_duration', 0) 
-                                       for b in plan_data['beats']),
-                'raw_response': response
-            }
-            
-            # Validate beats
-            for i, beat in enumerate(plan['beats'], 1):
-                if 'beat_number' not in beat:
-                    beat['beat_number'] = i
-                if 'title' not in beat:
-                    beat['title'] = f"Beat {i}"
-                if 'target_duration' not in beat:
-                    beat['target_duration'] = target_duration // len(plan['beats'])
-                if 'required_shot_types' not in beat:
-                    beat['required_shot_types'] = []
-                if 'requirements' not in beat:
-                    beat['requirements'] = []
-            
-            logger.info(f"[PLANNER] Parsed plan: {plan['total_beats']} beats, "
-                       f"{plan['planned_duration']}s planned duration")
-            
+
+            # Build complete plan with validated beats
+            default_duration = target_duration // max(len(plan_data['beats']), 1)
+            plan = Plan(
+                story_slug=story_slug,
+                brief=brief,
+                target_duration=target_duration,
+                beats=[Beat.from_dict(beat_dict, i, default_duration)
+                       for i, beat_dict in enumerate(plan_data['beats'], 1)],
+                raw_response=response
+            )
+
+            logger.info("[PLANNER] Parsed plan: %d beats, %ds planned duration",
+                       plan.total_beats, plan.planned_duration)
+
             return plan
             
         except json.JSONDecodeError as e:
-            logger.error(f"[PLANNER] Failed to parse JSON: {e}")
-            logger.error(f"[PLANNER] Response: {response[:500]}...")
+            logger.error("[PLANNER] Failed to parse JSON: %s", e)
+            logger.error("[PLANNER] Response: %s...", response[:500])
             
             # Return fallback plan
             return self._create_fallback_plan(story_slug, brief, target_duration)
         
         except Exception as e:
-            logger.error(f"[PLANNER] Failed to parse response: {e}")
+            logger.error("[PLANNER] Failed to parse response: %s", e)
             return self._create_fallback_plan(story_slug, brief, target_duration)
     
     def _create_fallback_plan(self,
                              story_slug: str,
                              brief: str,
-                             target_duration: int) -> Dict:
+                             target_duration: int) -> Plan:
         """
         Create a simple fallback plan if LLM parsing fails.
-        
+
         Args:
             story_slug: Story identifier
             brief: Editorial brief
             target_duration: Target duration
-            
+
         Returns:
             Simple 3-beat plan
         """
         logger.warning("[PLANNER] Creating fallback plan")
-        
+
         # Simple 3-beat structure
         beat_duration = target_duration // 3
-        
-        return {
-            'story_slug': story_slug,
-            'brief': brief,
-            'target_duration': target_duration,
-            'beats': [
-                {
-                    'beat_number': 1,
-                    'title': 'Opening',
-                    'description': 'Establish the story and context',
-                    'target_duration': beat_duration,
-                    'required_shot_types': ['GV', 'CUTAWAY'],
-                    'requirements': ['Establish location', 'Set scene']
-                },
-                {
-                    'beat_number': 2,
-                    'title': 'Development',
-                    'description': 'Main content and interviews',
-                    'target_duration': beat_duration,
-                    'required_shot_types': ['SOT', 'GV'],
-                    'requirements': ['Key interviews', 'Supporting visuals']
-                },
-                {
-                    'beat_number': 3,
-                    'title': 'Conclusion',
-                    'description': 'Wrap up and closing',
-                    'target_duration': beat_duration,
-                    'required_shot_types': ['GV', 'CUTAWAY'],
-                    'requirements': ['Closing visuals', 'Resolution']
-                }
+
+        return Plan(
+            story_slug=story_slug,
+            brief=brief,
+            target_duration=target_duration,
+            beats=[
+                Beat(
+                    beat_number=1,
+                    title='Opening',
+                    description='Establish the story and context',
+                    target_duration=beat_duration,
+                    required_shot_types=['GV', 'CUTAWAY'],
+                    requirements=['Establish location', 'Set scene']
+                ),
+                Beat(
+                    beat_number=2,
+                    title='Development',
+                    description='Main content and interviews',
+                    target_duration=beat_duration,
+                    required_shot_types=['SOT', 'GV'],
+                    requirements=['Key interviews', 'Supporting visuals']
+                ),
+                Beat(
+                    beat_number=3,
+                    title='Conclusion',
+                    description='Wrap up and closing',
+                    target_duration=beat_duration,
+                    required_shot_types=['GV', 'CUTAWAY'],
+                    requirements=['Closing visuals', 'Resolution']
+                )
             ],
-            'total_beats': 3,
-            'planned_duration': target_duration,
-            'fallback': True
-        }
+            fallback=True
+        )
     
     def refine_plan(self,
                    plan: Dict,
@@ -377,7 +496,7 @@ class Planner:
             Refined plan dictionary
         """
         logger.info("[PLANNER] Refining plan based on feedback")
-        logger.info(f"[PLANNER] Feedback: {feedback}")
+        logger.info("[PLANNER] Feedback: %s", feedback)
         
         # Format refinement context
         refinement_context = f"""# Plan Refinement Task
@@ -407,8 +526,8 @@ Return the updated plan as JSON.
                 plan['story_slug'],
                 plan['brief'],
                 plan['target_duration']
-            )
-            
+            ).to_dict()
+
             refined_plan['refined'] = True
             refined_plan['original_plan'] = plan
             refined_plan['refinement_feedback'] = feedback
@@ -418,6 +537,6 @@ Return the updated plan as JSON.
             return refined_plan
             
         except Exception as e:
-            logger.error(f"[PLANNER] ✗ Refinement failed: {e}")
+            logger.error("[PLANNER] ✗ Refinement failed: %s", e)
             # Return original plan if refinement fails
             return plan
@@ -0,0 +1 @@
+"""Prompt text data files for the News Edit Agent roles."""
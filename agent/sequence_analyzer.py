@@ -6,15 +6,25 @@ and visual similarity. This enables sequence-aware visual analysis for better
 editorial decisions and jump cut avoidance.
 """
 
+import hashlib
 import logging
+import re
 from typing import Dict, List, Optional, Tuple, Set
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+import faiss
 import numpy as np
 from sklearn.cluster import DBSCAN
 import yaml
 from pathlib import Path
 
+from agent._seq_numba import (
+    NUMBA_AVAILABLE,
+    cosine_neighbors,
+    dbscan_from_neighbors,
+    find_breaks,
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,16 +32,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters stripped from sequence names (anything but lowercase alnum/underscore)
+_DISALLOWED_NAME_CHARS = re.compile(r'[^a-z0-9_]+')
+
+# Gemini context classification: compact tags cached per shot
+_CTX_UNKNOWN, _CTX_INDOOR, _CTX_OUTDOOR = 0, 1, 2
+_INDOOR_RE = re.compile(r'indoor|interior')
+_OUTDOOR_RE = re.compile(r'outdoor|exterior')
+
+# Shot-count range where the numba region-query kernel beats sklearn's
+# generic ball-tree dispatch (below it, setup dominates; above it, the
+# tree's sub-quadratic search wins back)
+_NUMBA_DBSCAN_MIN_N = 500
+_NUMBA_DBSCAN_MAX_N = 5000
+
+# HNSW parameters for the approximate neighbor query above
+# _NUMBA_DBSCAN_MAX_N shots (same graph settings as storage.vector_index)
+_HNSW_M = 16
+_HNSW_EF_CONSTRUCTION = 200
+
 
 class SequenceAnalyzer:
     """Analyzes and groups shots into logical sequences for picking."""
     
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(self, config: Optional[Dict] = None, embedding_store=None):
         """
         Initialize sequence analyzer.
-        
+
         Args:
             config: Configuration dictionary (optional, will load from config.yaml if not provided)
+            embedding_store: Optional storage.embedding_store.EmbeddingStore; when
+                             provided, visual clustering reads embeddings from the
+                             shared memmap instead of per-shot Python lists
         """
         # Load config if not provided
         if config is None:
@@ -40,13 +72,20 @@ class SequenceAnalyzer:
                 config = yaml.safe_load(f)
         
         self.config = config
-        
+        self.embedding_store = embedding_store
+
         # Sequence grouping parameters (with defaults)
         seq_config = config.get('sequences', {}) if config else {}
         self.temporal_window_minutes = seq_config.get('temporal_window_minutes', 5)
         self.visual_similarity_threshold = seq_config.get('visual_similarity_threshold', 0.7)
         self.min_shots_per_sequence = seq_config.get('min_shots_per_sequence', 2)
         self.max_shots_per_sequence = seq_config.get('max_shots_per_sequence', 8)
+
+        # LRU cache of DBSCAN labels keyed by shot-set content hash;
+        # hybrid grouping and interactive sessions re-cluster the same
+        # subsets, so a hit skips the matrix build and clustering entirely
+        self.dbscan_cache_size = seq_config.get('dbscan_cache_size', 32)
+        self._dbscan_cache: 'OrderedDict[bytes, Dict[int, int]]' = OrderedDict()
         
         logger.info("[SEQUENCE_ANALYZER] Initialized")
         logger.info(f"[SEQUENCE_ANALYZER] Temporal window: {self.temporal_window_minutes} minutes")
@@ -98,39 +137,76 @@ class SequenceAnalyzer:
         
         return filtered_sequences
     
+    @staticmethod
+    def _context_tag(shot: Dict) -> int:
+        """
+        Classify a shot's gemini_context as indoor/outdoor/unknown,
+        caching the compact int tag on the shot dict.
+
+        Grouping methods re-check the same context strings on every call;
+        the tag turns repeated lower() + substring scans into a single
+        cached int comparison.
+
+        Args:
+            shot: Shot dictionary
+
+        Returns:
+            One of _CTX_UNKNOWN, _CTX_INDOOR, _CTX_OUTDOOR
+        """
+        tag = shot.get('_ctx_tag')
+        if tag is None:
+            context = (shot.get('gemini_context') or '').lower()
+            if _INDOOR_RE.search(context):
+                tag = _CTX_INDOOR
+            elif _OUTDOOR_RE.search(context):
+                tag = _CTX_OUTDOOR
+            else:
+                tag = _CTX_UNKNOWN
+            shot['_ctx_tag'] = tag
+        return tag
+
+    def _location_key(self, shot: Dict) -> str:
+        """
+        Compute the location bucket key for a shot.
+
+        Args:
+            shot: Shot dictionary
+
+        Returns:
+            Normalized location name, or a context-derived fallback
+        """
+        location = shot.get('location')
+        if location and location.strip():
+            return self._normalize_sequence_name(location)
+
+        # No location metadata - group by context tag if available
+        tag = self._context_tag(shot)
+        if tag == _CTX_INDOOR:
+            return 'indoor_unknown'
+        elif tag == _CTX_OUTDOOR:
+            return 'outdoor_unknown'
+        return 'location_unknown'
+
     def _group_by_location(self, shots: List[Dict]) -> Dict[str, List[Dict]]:
         """
         Group shots by location metadata.
-        
+
         Args:
             shots: List of shot dictionaries
-            
+
         Returns:
             Dictionary mapping location names to shots
         """
         sequences = defaultdict(list)
-        
+
         for shot in shots:
-            location = shot.get('location')
-            
-            if location and location.strip():
-                # Use location as sequence name
-                seq_name = self._normalize_sequence_name(location)
-            else:
-                # No location metadata - group by context if available
-                context = shot.get('gemini_context') or ''
-                context = context.lower()
-                if 'indoor' in context or 'interior' in context:
-                    seq_name = 'indoor_unknown'
-                elif 'outdoor' in context or 'exterior' in context:
-                    seq_name = 'outdoor_unknown'
-                else:
-                    seq_name = 'location_unknown'
-            
-            sequences[seq_name].append(shot)
+            sequences[self._location_key(shot)].append(shot)
         
         logger.info(f"[SEQUENCE_ANALYZER] Location grouping: {len(sequences)} groups")
-        return dict(sequences)
+        # defaultdict is mapping-compatible for callers; avoid the O(K)
+        # copy + rehash of dict(sequences). _filter_sequences builds the
+        # plain dict returned at the public boundary.
+        return sequences
     
     def _group_by_temporal_proximity(self, shots: List[Dict]) -> Dict[str, List[Dict]]:
         """
@@ -145,47 +221,156 @@ class SequenceAnalyzer:
         if not shots:
             return {}
         
-        # Sort by capture time
-        sorted_shots = sorted(shots, key=lambda s: s['capture_ts'])
-        
+        # Pull the timestamps into a contiguous array once (SoA view);
+        # sorting and the gap scan then run without touching the dicts
+        ts = np.fromiter(
+            (s['capture_ts'] for s in shots),
+            dtype=np.float64,
+            count=len(shots)
+        )
+        order = np.argsort(ts, kind='stable')
+        window_seconds = self.temporal_window_minutes * 60.0
+        breaks = find_breaks(ts[order], window_seconds)
+
         sequences = {}
-        current_sequence = []
-        sequence_count = 1
-        
-        for i, shot in enumerate(sorted_shots):
-            if not current_sequence:
-                # Start new sequence
-                current_sequence = [shot]
-            else:
-                # Check temporal proximity to last shot in current sequence
-                last_shot = current_sequence[-1]
-                time_diff_seconds = abs(shot['capture_ts'] - last_shot['capture_ts'])
-                time_diff_minutes = time_diff_seconds / 60.0
-                
-                if time_diff_minutes <= self.temporal_window_minutes:
-                    # Add to current sequence
-                    current_sequence.append(shot)
-                else:
-                    # Save current sequence and start new one
-                    seq_name = self._generate_temporal_sequence_name(
-                        current_sequence,
-                        sequence_count
-                    )
-                    sequences[seq_name] = current_sequence
-                    sequence_count += 1
-                    current_sequence = [shot]
-        
-        # Don't forget the last sequence
-        if current_sequence:
+        for sequence_count, group in enumerate(np.split(order, breaks), 1):
+            group_shots = [shots[i] for i in group]
             seq_name = self._generate_temporal_sequence_name(
-                current_sequence,
+                group_shots,
                 sequence_count
             )
-            sequences[seq_name] = current_sequence
-        
+            sequences[seq_name] = group_shots
+
         logger.info(f"[SEQUENCE_ANALYZER] Temporal grouping: {len(sequences)} sequences")
         return sequences
     
+    @staticmethod
+    def _ensure_quantized(shot: Dict) -> np.ndarray:
+        """
+        Return the shot's visual embedding as an int8-quantized normalized
+        vector, computing and caching it on the shot dict on first access.
+
+        Hybrid grouping calls visual clustering on overlapping subsets of
+        the same shots; caching makes the norm + divide run once per shot
+        across the whole pipeline. Storing int8 (scale 127 after L2
+        normalization) costs a quarter of a float32 copy, and 127-level
+        quantization of unit vectors is negligible for cosine clustering.
+
+        Args:
+            shot: Shot dictionary with a non-None 'embedding_visual'
+
+        Returns:
+            int8 quantized normalized embedding vector
+        """
+        quantized = shot.get('_embedding_visual_q8')
+        if quantized is None:
+            v = np.asarray(shot['embedding_visual'], dtype=np.float32)
+            v = v / (np.linalg.norm(v) + 1e-8)
+            quantized = np.round(v * 127.0).astype(np.int8)
+            shot['_embedding_visual_q8'] = quantized
+        return quantized
+
+    def _embeddings_from_store(self, shots: List[Dict]) -> np.ndarray:
+        """
+        Fetch normalized embeddings for the given shots from the configured
+        EmbeddingStore, inserting any shots seen for the first time.
+
+        Args:
+            shots: Shot dictionaries with non-None 'embedding_visual'
+
+        Returns:
+            (N, D) float32 matrix sliced from the memory-mapped store
+        """
+        store = self.embedding_store
+        rows = []
+        inserted = 0
+        for shot in shots:
+            row = store.row_for(shot['shot_id'])
+            if row is None:
+                row = store.add(shot['shot_id'], shot['embedding_visual'])
+                inserted += 1
+            rows.append(row)
+        if inserted:
+            store.flush()
+            logger.info("[SEQUENCE_ANALYZER] Added %d embeddings to store", inserted)
+        return store.embeddings[rows]
+
+    def _dbscan_cache_key(self, shot_ids: List[int]) -> bytes:
+        """
+        Content hash identifying a clustering run: the shot set (order
+        independent) plus the parameters that shape the labels.
+
+        Args:
+            shot_ids: Shot identifiers of the shots being clustered
+
+        Returns:
+            Digest bytes usable as a cache key
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(np.sort(np.asarray(shot_ids, dtype=np.int64)).tobytes())
+        hasher.update(repr((
+            self.visual_similarity_threshold,
+            self.min_shots_per_sequence,
+            self.max_shots_per_sequence
+        )).encode())
+        return hasher.digest()
+
+    def _store_dbscan_labels(self, cache_key: bytes,
+                             shot_ids: List[int],
+                             labels) -> None:
+        """
+        Cache clustering labels per shot_id, evicting the least recently
+        used entry past the configured size.
+
+        Args:
+            cache_key: Digest from _dbscan_cache_key
+            shot_ids: Shot identifiers, aligned with labels
+            labels: Cluster labels (array or list), -1 for noise
+        """
+        self._dbscan_cache[cache_key] = {
+            sid: int(label) for sid, label in zip(shot_ids, labels)
+        }
+        while len(self._dbscan_cache) > self.dbscan_cache_size:
+            self._dbscan_cache.popitem(last=False)
+
+    def _hnsw_dbscan_labels(self, embeddings_normalized: np.ndarray) -> np.ndarray:
+        """
+        DBSCAN labels for large shot lists via an approximate HNSW
+        neighbor query instead of an exact region query.
+
+        A FAISS HNSW graph answers the eps-radius lookup as a capped
+        kNN search in roughly O(N log N); the hits under the euclidean
+        eps form CSR neighbor lists fed to the shared cluster expansion.
+        Neighborhoods are capped at 2x max_shots_per_sequence, which is
+        well above min_shots_per_sequence, so core-point decisions and
+        cluster connectivity match the exact search in practice.
+
+        Args:
+            embeddings_normalized: (N, D) float32 L2-normalized embeddings
+
+        Returns:
+            int64 label array; -1 marks noise
+        """
+        n_shots, dim = embeddings_normalized.shape
+        index = faiss.IndexHNSWFlat(dim, _HNSW_M)
+        index.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+        index.add(embeddings_normalized)
+
+        k = min(n_shots, self.max_shots_per_sequence * 2)
+        index.hnsw.efSearch = max(64, 2 * k)
+        distances, neighbors = index.search(embeddings_normalized, k)
+
+        # IndexHNSWFlat reports squared L2; for unit vectors
+        # ||a-b||^2 = 2*(1 - sim), so the similarity threshold maps directly
+        eps_sq = 2.0 * (1.0 - self.visual_similarity_threshold)
+        mask = (distances <= eps_sq) & (neighbors >= 0)
+
+        offsets = np.zeros(n_shots + 1, dtype=np.int64)
+        np.cumsum(mask.sum(axis=1), out=offsets[1:])
+        indices = neighbors[mask].astype(np.int32)
+
+        return dbscan_from_neighbors(offsets, indices, self.min_shots_per_sequence)
+
     def _group_by_visual_similarity(self, shots: List[Dict]) -> Dict[str, List[Dict]]:
         """
         Group shots by visual similarity using CLIP embeddings.
@@ -196,41 +381,93 @@ class SequenceAnalyzer:
         Returns:
             Dictionary mapping visual sequence names to shots
         """
+        # Too few shots to split further - skip the clustering machinery
+        if len(shots) <= self.min_shots_per_sequence:
+            return {'visual_sequence_1': list(shots)}
+
         # Filter shots with visual embeddings
         shots_with_embeddings = [
             s for s in shots if s.get('embedding_visual') is not None
         ]
-        
+
         if len(shots_with_embeddings) < 2:
             logger.warning("[SEQUENCE_ANALYZER] Not enough shots with visual embeddings")
             # Fall back to single sequence
             return {'visual_sequence_1': shots}
         
-        # Extract embeddings as numpy array
-        embeddings = np.array([s['embedding_visual'] for s in shots_with_embeddings])
-        
-        # Normalize embeddings for cosine similarity
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        embeddings_normalized = embeddings / (norms + 1e-8)
-        
-        # Compute pairwise cosine similarities
-        similarity_matrix = np.dot(embeddings_normalized, embeddings_normalized.T)
-        
-        # Convert to distance matrix (1 - similarity)
-        # Clip to handle floating point precision issues
-        distance_matrix = np.clip(1 - similarity_matrix, 0.0, 2.0)
-        
-        # Apply DBSCAN clustering
-        # eps is the maximum distance for samples to be considered neighbors
-        eps = 1 - self.visual_similarity_threshold  # Convert similarity to distance
-        clustering = DBSCAN(
-            eps=eps,
-            min_samples=self.min_shots_per_sequence,
-            metric='precomputed'
-        )
-        
-        labels = clustering.fit_predict(distance_matrix)
-        
+        shot_ids = [s['shot_id'] for s in shots_with_embeddings]
+        cache_key = self._dbscan_cache_key(shot_ids)
+        cached_labels = self._dbscan_cache.get(cache_key)
+
+        if cached_labels is not None:
+            # Same shot set and parameters as a previous clustering run:
+            # regroup from the stored labels, no matrix build needed
+            self._dbscan_cache.move_to_end(cache_key)
+            logger.info("[SEQUENCE_ANALYZER] DBSCAN cache hit (%d shots)",
+                        len(shot_ids))
+            labels = [cached_labels[sid] for sid in shot_ids]
+        else:
+            if self.embedding_store is not None:
+                # Slice straight out of the shared memmap: rows are already
+                # L2-normalized float32, and repeat analyses (or sibling
+                # processes) hit the same OS page cache instead of rebuilding
+                # the matrix from per-shot Python lists.
+                embeddings_normalized = self._embeddings_from_store(shots_with_embeddings)
+            else:
+                # Stream the per-shot cached quantized embeddings into a
+                # preallocated contiguous float32 buffer (avoids the intermediate
+                # Python list and dtype/shape inference of np.array(list-comp)),
+                # then dequantize in place for the euclidean neighborhood search.
+                # The whole similarity path stays float32: no float64 promotion
+                # means half the memory traffic and twice the SIMD width in the
+                # tree build compared to numpy's default dtype inference.
+                first = self._ensure_quantized(shots_with_embeddings[0])
+                embeddings_normalized = np.empty(
+                    (len(shots_with_embeddings), first.shape[0]), dtype=np.float32
+                )
+                embeddings_normalized[0] = first
+                for i, s in enumerate(shots_with_embeddings[1:], 1):
+                    embeddings_normalized[i] = self._ensure_quantized(s)
+                embeddings_normalized *= 1.0 / 127.0
+
+            n_shots = embeddings_normalized.shape[0]
+            if not (embeddings_normalized != embeddings_normalized[0]).any():
+                # All embeddings identical (common after Gemini analysis
+                # reuse): DBSCAN would put everything in one cluster
+                labels = np.zeros(n_shots, dtype=np.int64)
+            elif n_shots > _NUMBA_DBSCAN_MAX_N:
+                # Large N: approximate HNSW neighborhoods in O(N log N)
+                # replace the exact (near-quadratic) region query
+                labels = self._hnsw_dbscan_labels(embeddings_normalized)
+            elif NUMBA_AVAILABLE and _NUMBA_DBSCAN_MIN_N <= n_shots:
+                # Mid-size N: a parallel numba region query on the similarity
+                # threshold plus a cheap Python cluster expansion avoids
+                # sklearn's per-point dispatch overhead
+                offsets, indices = cosine_neighbors(
+                    embeddings_normalized, self.visual_similarity_threshold
+                )
+                labels = dbscan_from_neighbors(
+                    offsets, indices, self.min_shots_per_sequence
+                )
+            else:
+                # Apply DBSCAN clustering directly on the normalized vectors.
+                # For unit vectors, cosine distance (1 - sim) relates to euclidean
+                # distance as ||a-b||^2 = 2*(1 - sim), so the similarity threshold
+                # translates to a euclidean eps and a ball-tree neighborhood search
+                # replaces the O(N^2) precomputed distance matrix.
+                eps_euclid = np.sqrt(2.0 * (1.0 - self.visual_similarity_threshold))
+                clustering = DBSCAN(
+                    eps=eps_euclid,
+                    min_samples=self.min_shots_per_sequence,
+                    metric='euclidean',
+                    algorithm='ball_tree',
+                    n_jobs=-1
+                )
+
+                labels = clustering.fit_predict(embeddings_normalized)
+
+            self._store_dbscan_labels(cache_key, shot_ids, labels)
+
         # Group shots by cluster labels
         sequences = defaultdict(list)
         for shot, label in zip(shots_with_embeddings, labels):
@@ -252,7 +489,10 @@ class SequenceAnalyzer:
             sequences['visual_outliers'].extend(shots_without_embeddings)
         
         logger.info(f"[SEQUENCE_ANALYZER] Visual grouping: {len(sequences)} clusters")
-        return dict(sequences)
+        # defaultdict is mapping-compatible for callers; avoid the O(K)
+        # copy + rehash of dict(sequences). _filter_sequences builds the
+        # plain dict returned at the public boundary.
+        return sequences
     
     def _hybrid_grouping(self, shots: List[Dict]) -> Dict[str, List[Dict]]:
         """
@@ -270,34 +510,47 @@ class SequenceAnalyzer:
             Dictionary mapping hybrid sequence names to shots
         """
         logger.info("[SEQUENCE_ANALYZER] Applying hybrid grouping strategy")
-        
-        # Step 1: Group by location
-        location_groups = self._group_by_location(shots)
-        
+
+        # Step 1: Single pass assigning each shot its location bucket
+        location_groups = defaultdict(list)
+        for shot in shots:
+            location_groups[self._location_key(shot)].append(shot)
+
         final_sequences = {}
-        
+        window_seconds = self.temporal_window_minutes * 60.0
+
         for loc_name, loc_shots in location_groups.items():
             logger.info(f"[SEQUENCE_ANALYZER] Processing location group '{loc_name}' "
                        f"({len(loc_shots)} shots)")
-            
-            # Step 2: Apply temporal clustering within location
-            temporal_seqs = self._group_by_temporal_proximity(loc_shots)
-            
-            for temp_name, temp_shots in temporal_seqs.items():
+
+            # Step 2: Temporal split on the timestamp array directly
+            # (no per-subset Python re-sort or intermediate name dict)
+            ts = np.fromiter(
+                (s['capture_ts'] for s in loc_shots),
+                dtype=np.float64,
+                count=len(loc_shots)
+            )
+            order = np.argsort(ts, kind='stable')
+            breaks = find_breaks(ts[order], window_seconds)
+
+            for seq_num, group in enumerate(np.split(order, breaks), 1):
+                temp_shots = [loc_shots[i] for i in group]
+
                 # Check if this temporal sequence is too large
                 if len(temp_shots) > self.max_shots_per_sequence:
                     logger.info(f"[SEQUENCE_ANALYZER] Temporal sequence too large "
                                f"({len(temp_shots)} shots), applying visual split")
-                    
+
                     # Step 3: Further split by visual similarity
                     visual_seqs = self._group_by_visual_similarity(temp_shots)
-                    
+
                     for vis_name, vis_shots in visual_seqs.items():
                         # Combine names
                         combined_name = f"{loc_name}_{vis_name}"
                         final_sequences[combined_name] = vis_shots
                 else:
-                    # Name the sequence
+                    # Name the sequence (only buckets that survive intact)
+                    temp_name = self._generate_temporal_sequence_name(temp_shots, seq_num)
                     combined_name = f"{loc_name}_{temp_name}"
                     final_sequences[combined_name] = temp_shots
         
@@ -325,17 +578,26 @@ class SequenceAnalyzer:
                 # Sequence too large - trim to max size (keep best shots)
                 logger.warning(f"[SEQUENCE_ANALYZER] Trimming '{seq_name}' from "
                              f"{len(shots)} to {self.max_shots_per_sequence} shots")
-                
-                # Sort by relevance score if available
-                sorted_shots = sorted(
-                    shots,
-                    key=lambda s: s.get('relevance_score', 0),
-                    reverse=True
+
+                # O(N) top-K selection on relevance scores instead of a
+                # full sort; only the kept K are re-sorted for determinism
+                k = self.max_shots_per_sequence
+                scores = np.fromiter(
+                    (s.get('relevance_score', 0) for s in shots),
+                    dtype=np.float32,
+                    count=len(shots)
                 )
-                filtered[seq_name] = sorted_shots[:self.max_shots_per_sequence]
+                top_idx = np.argpartition(-scores, k)[:k]
+                top_idx = top_idx[np.argsort(-scores[top_idx], kind='stable')]
+
+                kept = np.zeros(len(shots), dtype=bool)
+                kept[top_idx] = True
+
+                filtered[seq_name] = [shots[i] for i in top_idx]
                 # Add trimmed shots to miscellaneous
-                trimmed_shots = sorted_shots[self.max_shots_per_sequence:]
-                small_shots.extend(trimmed_shots)
+                small_shots.extend(
+                    shot for i, shot in enumerate(shots) if not kept[i]
+                )
             else:
                 # Sequence is within acceptable size
                 filtered[seq_name] = shots
@@ -358,15 +620,11 @@ class SequenceAnalyzer:
         Returns:
             Normalized name (lowercase, underscores)
         """
-        # Convert to lowercase and replace spaces with underscores
-        normalized = name.lower().strip()
-        normalized = normalized.replace(' ', '_')
-        normalized = normalized.replace('-', '_')
-        
-        # Remove special characters
-        normalized = ''.join(c for c in normalized if c.isalnum() or c == '_')
-        
-        return normalized
+        # Lowercase, map separators to underscores, then strip special
+        # characters with a precompiled regex (C-level scan rather than a
+        # Python generator per character)
+        normalized = name.lower().strip().replace(' ', '_').replace('-', '_')
+        return _DISALLOWED_NAME_CHARS.sub('', normalized)
     
     def _generate_temporal_sequence_name(self,
                                         shots: List[Dict],
@@ -385,29 +643,20 @@ class SequenceAnalyzer:
             return f"temporal_seq_{sequence_num}"
         
         # Try to use location info if available
-        locations: List[str] = [s['location'] for s in shots if s.get('location')]
-        if locations:
-            # Use most common location
-            location_counts: Dict[str, int] = defaultdict(int)
-            for loc in locations:
-                location_counts[loc] += 1
-            most_common = max(location_counts.items(), key=lambda x: x[1])[0]
+        location_counts = Counter(
+            s['location'] for s in shots if s.get('location')
+        )
+        if location_counts:
+            # Use most common location (count + argmax run in C)
+            most_common = location_counts.most_common(1)[0][0]
             return self._normalize_sequence_name(f"{most_common}_seq_{sequence_num}")
         
-        # Try to use Gemini context info
-        contexts = []
-        for shot in shots:
-            context = shot.get('gemini_context', '')
-            if context:
-                contexts.append(context)
-        
-        if contexts:
-            # Simple heuristic: look for common keywords
-            context_text = ' '.join(contexts).lower()
-            if 'indoor' in context_text or 'interior' in context_text:
-                return f"indoor_seq_{sequence_num}"
-            elif 'outdoor' in context_text or 'exterior' in context_text:
-                return f"outdoor_seq_{sequence_num}"
+        # Try to use Gemini context info via the cached per-shot tags
+        tags = [self._context_tag(s) for s in shots]
+        if _CTX_INDOOR in tags:
+            return f"indoor_seq_{sequence_num}"
+        elif _CTX_OUTDOOR in tags:
+            return f"outdoor_seq_{sequence_num}"
         
         # Fallback to generic name
         return f"temporal_seq_{sequence_num}"
@@ -431,27 +680,29 @@ class SequenceAnalyzer:
                 'time_span_minutes': 0.0
             }
         
-        # Calculate statistics
-        shot_types = [s.get('shot_type', 'UNKNOWN') for s in sequence]
-        shot_type_counts = defaultdict(int)
-        for st in shot_types:
-            shot_type_counts[st] += 1
-        
-        total_duration = sum(s['duration_ms'] / 1000.0 for s in sequence)
-        
-        # Time span
-        timestamps = [s['capture_ts'] for s in sequence]
-        time_span_seconds = max(timestamps) - min(timestamps)
-        time_span_minutes = time_span_seconds / 60.0
-        
+        # Accumulate all statistics in a single pass over the shots
+        shot_type_counts: Dict[str, int] = {}
+        total_duration_ms = 0
+        first_ts = last_ts = sequence[0]['capture_ts']
+
+        for s in sequence:
+            total_duration_ms += s['duration_ms']
+            ts = s['capture_ts']
+            if ts < first_ts:
+                first_ts = ts
+            if ts > last_ts:
+                last_ts = ts
+            shot_type = s.get('shot_type', 'UNKNOWN')
+            shot_type_counts[shot_type] = shot_type_counts.get(shot_type, 0) + 1
+
         return {
             'shot_count': len(sequence),
-            'total_duration': total_duration,
-            'shot_types': dict(shot_type_counts),
+            'total_duration': total_duration_ms / 1000.0,
+            'shot_types': shot_type_counts,
             'has_sot': 'SOT' in shot_type_counts,
-            'time_span_minutes': time_span_minutes,
-            'first_timestamp': min(timestamps),
-            'last_timestamp': max(timestamps)
+            'time_span_minutes': (last_ts - first_ts) / 60.0,
+            'first_timestamp': first_ts,
+            'last_timestamp': last_ts
         }
     
     def summarize_sequences(self, sequences: Dict[str, List[Dict]]) -> str:
@@ -464,20 +715,22 @@ class SequenceAnalyzer:
         Returns:
             Formatted summary string
         """
-        lines = []
-        lines.append(f"## Sequence Summary")
-        lines.append(f"Total Sequences: {len(sequences)}")
-        lines.append("")
-        
+        # Preallocate the exact line count (3 header lines + 7 per
+        # sequence) and index-assign: no per-append list resizing, and
+        # one join at the end instead of incremental string building
+        lines = [''] * (3 + 7 * len(sequences))
+        lines[0] = "## Sequence Summary"
+        lines[1] = f"Total Sequences: {len(sequences)}"
+
+        pos = 3
         for seq_name, shots in sequences.items():
             metadata = self.get_sequence_metadata(shots)
-            
-            lines.append(f"### {seq_name}")
-            lines.append(f"- Shots: {metadata['shot_count']}")
-            lines.append(f"- Duration: {metadata['total_duration']:.1f}s")
-            lines.append(f"- Time Span: {metadata['time_span_minutes']:.1f} minutes")
-            lines.append(f"- Shot Types: {metadata['shot_types']}")
-            lines.append(f"- Has SOT: {'Yes' if metadata['has_sot'] else 'No'}")
-            lines.append("")
-        
+            lines[pos] = f"### {seq_name}"
+            lines[pos + 1] = f"- Shots: {metadata['shot_count']}"
+            lines[pos + 2] = f"- Duration: {metadata['total_duration']:.1f}s"
+            lines[pos + 3] = f"- Time Span: {metadata['time_span_minutes']:.1f} minutes"
+            lines[pos + 4] = f"- Shot Types: {metadata['shot_types']}"
+            lines[pos + 5] = f"- Has SOT: {'Yes' if metadata['has_sot'] else 'No'}"
+            pos += 7
+
         return "\n".join(lines)
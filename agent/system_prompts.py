@@ -2,342 +2,112 @@
 System prompts for the News Edit Agent.
 
 These prompts define the agent's behavior and capabilities for different tasks.
-"""
-
-# Main agent system prompt
-AGENT_SYSTEM_PROMPT = """You are an expert news video editor with deep knowledge of broadcast journalism, storytelling, and video production. You work for Reuters, creating compelling news packages from raw footage (rushes).
-
-## Your Role
-
-You help journalists and editors compile news stories by:
-1. **Analyzing** raw video footage, transcripts, and metadata
-2. **Planning** story structures based on editorial briefs
-3. **Selecting** the best shots to tell the story effectively
-4. **Sequencing** shots for maximum impact and clarity
-5. **Verifying** edits meet broadcast standards
-
-## Your Expertise
-
-**Editorial Judgment:**
-- Strong news sense and understanding of story hierarchy
-- Ability to identify the most newsworthy elements
-- Knowledge of Reuters editorial standards and ethics
-
-**Visual Storytelling:**
-- Shot selection based on composition, action, and relevance
-- Pacing and rhythm for different story types (breaking news, features, analysis)
-- Use of sequences: establishing shots, action, cutaways, reactions
-- Visual variety and avoiding jump cuts
-
-**Technical Knowledge:**
-- Shot types: SOT (Sound on Tape), GV (General View), CUTAWAY
-- Shot composition: wide, medium, close-up
-- Audio considerations: nat sound, ambient audio, interview quality
-- Timing and duration for broadcast standards
-
-**Broadcast Standards:**
-- Typical package lengths: 60-90 seconds for breaking news, 90-120 for features
-- Shot duration guidelines: 3-5 seconds minimum, avoid lingering
-- Audio/visual sync requirements
-- Legal and ethical considerations (permissions, sensitive content)
-
-## Your Workflow
-
-When given a task, you:
-
-1. **Understand the Brief**: Analyze the story requirements, target duration, and editorial angle
-2. **Review Available Content**: Examine shots, transcripts, and metadata
-3. **Plan the Structure**: Create a beat-by-beat outline (intro, development, conclusion)
-4. **Select Shots**: Choose specific shots that best serve each beat
-5. **Sequence Carefully**: Order shots for narrative flow and visual coherence
-6. **Verify Quality**: Check timing, pacing, and broadcast standards
-
-## Response Format
-
-Always structure your responses clearly:
-- Use **bold** for key decisions
-- Provide **reasoning** for shot selections
-- Include **timecodes** when referencing specific moments
-- Flag any **concerns** or **alternatives** to consider
 
-## Key Principles
-
-1. **Story First**: Every shot must serve the narrative
-2. **Show, Don't Tell**: Prefer visual storytelling over relying on narration
-3. **Accuracy**: Never misrepresent what footage shows
-4. **Efficiency**: Respect the target duration while telling a complete story
-5. **Quality**: Maintain high broadcast standards throughout
-
-You communicate professionally but conversationally, explaining your editorial choices clearly."""
-
-
-# Planner-specific prompt
-PLANNER_SYSTEM_PROMPT = """You are the Planning module of a news video editing agent. Your role is to create detailed story structures.
-
-Given:
-- An editorial brief describing the story
-- Available shots with transcripts and metadata
-- Target duration
-
-You must:
-1. Analyze the brief to understand the story angle and key messages
-2. Review available content to identify strong material
-3. Create a beat-by-beat structure with:
-   - Clear narrative arc (beginning, middle, end)
-   - Specific beats/moments that need to be covered
-   - Suggested shot types for each beat
-   - Approximate timing for each section
-
-Output a structured plan in JSON format with:
-- story_angle: The main editorial angle
-- beats: Array of story beats, each with:
-  - beat_number: Sequential number
-  - description: What this beat covers
-  - purpose: Why this beat is important
-  - suggested_duration: Seconds for this beat
-  - shot_requirements: What types of shots are needed
-
-Be specific and actionable. Your plan guides the shot selection process."""
-
-
-# Picker-specific prompt
-PICKER_SYSTEM_PROMPT = """You are the Shot Selection module of a news video editing agent. Your role is to choose the best shots for each story beat using professional editing principles.
-
-## THE 6 ELEMENTS OF A GOOD EDIT
-
-For EVERY transition between shots, you must evaluate these 6 elements:
-
-1. **INFORMATION**: Does the next shot provide NEW visual or audio data?
-2. **MOTIVATION**: Is there a clear reason to cut NOW? (action, sound, dialogue beat, new information)
-3. **COMPOSITION**: Are the frames sufficiently different? (avoid similar framing)
-4. **CAMERA ANGLE**: Is there at least a 30-degree change in camera angle or shot size?
-5. **CONTINUITY**: Do movement, position, sound, and subjects match appropriately?
-6. **SOUND**: Does the audio support the visual transition?
-
-**SCORING YOUR EDITS:**
-- ✅ **Strong Edit**: 4-6 elements satisfied → USE THIS EDIT
-- ⚠️ **Weak Edit**: 2-3 elements satisfied → RECONSIDER
-- ❌ **Avoid**: 0-1 elements satisfied → DO NOT USE
-
-## SHOT DURATION GUIDELINES
-
-- **Minimum**: 3 seconds (except quick action cuts)
-- **Maximum**: 10-12 seconds (except long SOT interviews)
-- **Rule of thumb**: Speak the shot description aloud - when done, cut
-- **Vary lengths**: Mix short (3-5s), medium (5-8s), and longer (8-12s) shots for rhythm
-
-## NEWS EDITING PRIORITIES
-
-1. **Factual accuracy** - Never misrepresent content
-2. **Temporal accuracy** - Maintain chronological flow
-3. **Speaker intent** - Preserve meaning in sound bites
-4. **Clear information** - Each shot advances the story
-5. **Appropriate pacing** - Match urgency to story type
-6. **Professional sound** - Clean audio throughout
-
-## SHOT SELECTION PROCESS
-
-Given:
-- A story plan with defined beats
-- A working set of candidate shots with:
-  - Shot type and size (CU/MCU/MS/LS etc)
-  - Visual descriptions (composition, camera movement, subjects, action)
-  - Transcripts (for SOT)
-  - Shot metadata (duration, quality)
-  - Gemini visual analysis
-
-You must:
-
-1. **Evaluate each candidate** against beat requirements
-2. **For each potential edit**, explicitly assess the 6 elements:
-   - Information: What new data does this shot provide?
-   - Motivation: Why cut to this shot now?
-   - Composition: How different is the framing?
-   - Camera Angle: What's the angle/size change?
-   - Continuity: Does it flow from previous shot?
-   - Sound: Does audio support the transition?
-3. **Score the edit**: Count how many elements are satisfied (0-6)
-4. **Only select edits with 4+ elements satisfied**
-5. **Ensure shot variety**: Mix of shot sizes (wide, medium, close-up)
-6. **Check duration**: Each shot meets minimum/maximum guidelines
-7. **Verify continuity**: Subjects, screen direction, lighting consistency
-
-## OUTPUT FORMAT
-
-Return selections as JSON:
-```json
-{
-  "shots": [
-    {
-      "shot_id": 123,
-      "reason": "Why this shot was selected",
-      "trim_in": "00:00:05:00",
-      "trim_out": "00:00:10:00",
-      "duration": 5.0,
-      "six_elements_score": 5,
-      "elements_satisfied": ["information", "motivation", "composition", "angle", "sound"]
-    }
-  ],
-  "reasoning": "Overall reasoning for this selection",
-  "shot_variety": "Mix of CU (2), MS (3), LS (1)",
-  "total_duration": 30.5
-}
-```
+This module is the single canonical source of prompt text: every role
+prompt is defined exactly once, so LLM prompt-cache keys derived from
+the constants are deterministic across workers and import orders.
 
-## KEY PRINCIPLES
-
-- **Story First**: Every shot must serve the narrative
-- **Show, Don't Tell**: Prefer visual storytelling
-- **Cuts Only**: Use straight cuts (no dissolves/wipes for news)
-- **Quality Matters**: Avoid poor quality shots
-- **Variety**: Mix shot sizes for visual interest
-- **Rhythm**: Vary shot durations for engagement
-
-For each shot selection, explicitly state which of the 6 elements are satisfied and why."""
-
-
-# Verifier-specific prompt
-VERIFIER_SYSTEM_PROMPT = """You are the Verification module of a news video editing agent. Your role is to review compiled edits for quality and broadcast standards using professional editing principles.
-
-## THE 6 ELEMENTS VALIDATION
-
-For EVERY transition between shots in the edit, evaluate:
-
-1. **INFORMATION**: Does the next shot provide NEW visual or audio data?
-2. **MOTIVATION**: Is there a clear reason to cut NOW?
-3. **COMPOSITION**: Are the frames sufficiently different?
-4. **CAMERA ANGLE**: Is there at least a 30-degree change in angle or shot size?
-5. **CONTINUITY**: Do movement, position, sound, and subjects match appropriately?
-6. **SOUND**: Does the audio support the visual transition?
-
-**Score each transition:**
-- ✅ **Strong Edit**: 4-6 elements satisfied
-- ⚠️ **Weak Edit**: 2-3 elements satisfied → FLAG AS ISSUE
-- ❌ **Poor Edit**: 0-1 elements satisfied → FLAG AS CRITICAL ISSUE
-
-## VERIFICATION CHECKLIST
-
-**Editorial Quality:**
-- Does the edit tell a coherent story?
-- Are all key beats from the plan covered?
-- Is the story angle clear and consistent?
-- Does it meet the editorial brief requirements?
-- Is factual accuracy maintained?
-- Is temporal accuracy preserved (chronological flow)?
-- Is speaker intent preserved in sound bites?
-
-**Technical Quality:**
-- **Shot Durations**: 
-  - Minimum 3 seconds (except action cuts)
-  - Maximum 10-12 seconds (except long SOT)
-  - Varied lengths for rhythm (mix of 3-5s, 5-8s, 8-12s)
-- **Shot Variety**:
-  - Mix of shot sizes (wide, medium, close-up)
-  - No overuse of any single shot type
-  - Visual diversity throughout
-- **Transitions**:
-  - All cuts are straight cuts (no dissolves/wipes)
-  - No jump cuts (insufficient angle change)
-  - Smooth flow between shots
-- **Duration**: Total within target range (±10%)
-
-**Continuity Checks:**
-- Screen direction consistency (180-degree rule)
-- Subject continuity (same subjects don't disappear/reappear)
-- Lighting consistency (no jarring changes)
-- Audio perspective matches visuals
-- No incomplete thoughts in sound bites
-
-**Broadcast Standards:**
-- Audio quality acceptable for all SOT
-- Professional sound throughout
-- No sensitive content without proper context
-- Proper attribution for all sources
-- Meets Reuters editorial guidelines
-
-**Pacing & Rhythm:**
-- Appropriate pacing for story type
-- Shot duration variety creates rhythm
-- No monotonous pacing (all shots same length)
-- Energy level appropriate to content
-
-## OUTPUT FORMAT
-
-Return verification report as JSON:
-```json
-{
-  "overall_score": 8,
-  "scores": {
-    "narrative_flow": 8,
-    "brief_compliance": 9,
-    "technical_quality": 7,
-    "broadcast_standards": 8,
-    "six_elements_average": 4.5
-  },
-  "transition_analysis": [
-    {
-      "from_shot": 123,
-      "to_shot": 124,
-      "six_elements_score": 5,
-      "elements_satisfied": ["information", "motivation", "composition", "angle", "sound"],
-      "status": "strong"
-    }
-  ],
-  "shot_variety_analysis": {
-    "wide_shots": 2,
-    "medium_shots": 5,
-    "close_ups": 3,
-    "variety_score": "good"
-  },
-  "duration_analysis": {
-    "total_duration": 118.5,
-    "target_duration": 120,
-    "shot_count": 10,
-    "avg_shot_duration": 11.85,
-    "duration_variety": "good"
-  },
-  "strengths": ["List of strengths"],
-  "issues": [
-    {
-      "severity": "high|medium|low",
-      "category": "narrative|technical|continuity|standards",
-      "description": "Issue description",
-      "location": "Between shots X and Y",
-      "suggestion": "How to fix"
-    }
-  ],
-  "recommendations": ["List of recommendations"],
-  "approved": true
-}
-```
-
-## CRITICAL ISSUES (Must Fix)
-
-- Any transition with 0-1 elements satisfied
-- Jump cuts (similar angles without motivation)
-- Crossing the 180-degree line
-- Shots under 2 seconds (except action cuts)
-- Incomplete thoughts in sound bites
-- Factual inaccuracies
-- Poor audio quality in SOT
+Contract: the system prompts are fully static. Per-request context
+(candidate shots, plans, briefs) must travel in user messages — never
+spliced into these constants — or every provider prompt-cache entry is
+invalidated on each call.
+"""
 
-## MAJOR ISSUES (Should Fix)
+import array
+import functools
+import hashlib
+import importlib.resources
+import os
+import re
+from pathlib import Path
+from types import MappingProxyType
+
+__all__ = [
+    'PROMPT_VERSION',
+    'SYSTEM_PROMPT_IS_STATIC',
+    'SYSTEM_PROMPT_SHA256',
+    'AGENT_SYSTEM_PROMPT',
+    'PLANNER_SYSTEM_PROMPT',
+    'PICKER_SYSTEM_PROMPT',
+    'VERIFIER_SYSTEM_PROMPT',
+    'get_sequence_analysis_prompt',
+    'get_system_prompt',
+    'get_system_prompt_blocks',
+    'get_system_prompt_bytes',
+    'get_system_prompt_tokens',
+    'iter_batch_requests',
+    'kv_cache_path',
+    'load_kv_cache',
+    'persist_kv_cache',
+    'write_batch_file',
+]
+
+# Survives importlib.reload (reload re-executes the module body in the
+# same namespace, so this guard keeps the already-read strings instead
+# of reallocating them — pytest reloads and Jupyter autoreload would
+# otherwise pay the file reads and string churn on every pass)
+if '_PROMPT_TEXT_CACHE' not in globals():
+    _PROMPT_TEXT_CACHE: dict = {}
+
+
+def _load(name: str) -> str:
+    """Read a prompt data file from agent/prompts (cached across reloads)."""
+    text = _PROMPT_TEXT_CACHE.get(name)
+    if text is None:
+        text = importlib.resources.files('agent.prompts') \
+            .joinpath(f'{name}.md').read_text('utf-8')
+        _PROMPT_TEXT_CACHE[name] = text
+    return text
+
+
+# The 6-elements rubric shared verbatim by the picker and verifier
+# prompts: a single source for the text (no drift between roles), and
+# direct-API callers can emit it as its own cache_control block shared
+# across both agents' turns.
+_SIX_ELEMENTS_BLOCK = _load('six_elements')
+
+# Prompt text lives in agent/prompts/*.md rather than triple-quoted
+# literals: the .pyc stays small, cold import skips unmarshalling ~8 KB
+# of string data, and the OS page cache shares one copy of the files
+# across worker processes. The picker/verifier files carry a
+# {{SIX_ELEMENTS}} marker replaced with the shared rubric here.
+AGENT_SYSTEM_PROMPT = _load('agent')
+PLANNER_SYSTEM_PROMPT = _load('planner')
+PICKER_SYSTEM_PROMPT = _load('picker').replace('{{SIX_ELEMENTS}}', _SIX_ELEMENTS_BLOCK)
+VERIFIER_SYSTEM_PROMPT = _load('verifier').replace('{{SIX_ELEMENTS}}', _SIX_ELEMENTS_BLOCK)
+
+# Decorative characters that cost tokens without carrying instruction
+_ORNAMENT_RE = re.compile('[✅⚠️❌→]')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+_TRAILING_WS_RE = re.compile(r'[ \t]+\n')
+
+
+def _compact(text: str) -> str:
+    """
+    Strip markdown ornamentation that costs input tokens on every call
+    without changing the prompt's meaning: emoji/arrow glyphs, trailing
+    whitespace, and runs of blank lines.
 
-- Transitions with only 2-3 elements satisfied
-- Lack of shot variety (all same size)
-- Monotonous pacing (all shots same duration)
-- Duration significantly off target (>15%)
-- Weak narrative flow
-- Missing key beats from plan
+    Args:
+        text: Prompt text
 
-## MINOR ISSUES (Consider Fixing)
+    Returns:
+        Compacted prompt text
+    """
+    text = _ORNAMENT_RE.sub('', text)
+    text = _TRAILING_WS_RE.sub('\n', text)
+    return _BLANK_RUN_RE.sub('\n\n', text)
 
-- Shots slightly under 3 seconds
-- Limited shot variety in one section
-- Minor pacing issues
-- Small duration variance from target (<10%)
 
-Be thorough, specific, and constructive. For each issue, cite the specific shots involved and explain which of the 6 elements are missing."""
+# Opt-in (RAWRE_COMPACT_PROMPTS=1) so compacted and verbatim prompts can
+# be A/B compared; note a flipped flag changes prompt bytes and therefore
+# every provider cache key and PROMPT_VERSION digest below.
+COMPACT_PROMPTS = os.getenv('RAWRE_COMPACT_PROMPTS') == '1'
+if COMPACT_PROMPTS:
+    AGENT_SYSTEM_PROMPT = _compact(AGENT_SYSTEM_PROMPT)
+    PLANNER_SYSTEM_PROMPT = _compact(PLANNER_SYSTEM_PROMPT)
+    PICKER_SYSTEM_PROMPT = _compact(PICKER_SYSTEM_PROMPT)
+    VERIFIER_SYSTEM_PROMPT = _compact(VERIFIER_SYSTEM_PROMPT)
 
 
 # Gemini sequence analysis prompt
@@ -459,7 +229,60 @@ Be specific and actionable. Your analysis will guide the editorial selection pro
 Respond ONLY with the JSON object, no additional text or markdown formatting."""
 
 
+# Role -> prompt mapping, built once at import rather than per call.
+# Read-only proxy: shared safely across threads, and nothing can rebind
+# a role's prompt after the digests below are computed.
+_PROMPTS = MappingProxyType({
+    "agent": AGENT_SYSTEM_PROMPT,
+    "planner": PLANNER_SYSTEM_PROMPT,
+    "picker": PICKER_SYSTEM_PROMPT,
+    "verifier": VERIFIER_SYSTEM_PROMPT
+})
+
+# Contract flag for callers: these prompts carry no per-request
+# content, so they are safe to cache across the whole agent loop
+SYSTEM_PROMPT_IS_STATIC = True
+
+# Provider prefix caches only hit on a byte-identical leading span, so
+# the opening of each prompt must stay plain ASCII with no templating.
+# Guarded at import so an edit that slips dynamic content or multi-byte
+# characters into the prefix fails fast instead of silently degrading
+# cache hit rates.
+_CACHE_SAFE_PREFIX_LEN = 1024
+for _role, _prompt in _PROMPTS.items():
+    _prefix = _prompt[:_CACHE_SAFE_PREFIX_LEN]
+    assert _prefix.isascii() and '{' not in _prefix, (
+        f"System prompt '{_role}' has non-ASCII or templated content in "
+        f"its first {_CACHE_SAFE_PREFIX_LEN} characters"
+    )
+del _role, _prompt, _prefix
+
+# UTF-8 encodings built once at import: HTTP clients re-encode a str
+# payload per request, so transports that accept bytes can skip one
+# prompt-sized encode+alloc per LLM call
+_PROMPT_BYTES = {
+    role: prompt.encode('utf-8') for role, prompt in _PROMPTS.items()
+}
+
+# Stable content digests per role, usable as exact-cache keys for
+# responses (a changed prompt changes the digest and misses cleanly)
+SYSTEM_PROMPT_SHA256 = {
+    role: hashlib.sha256(prompt_bytes).hexdigest()
+    for role, prompt_bytes in _PROMPT_BYTES.items()
+}
+
+# Short per-role version identifiers for response-cache keys (Redis,
+# GPTCache-style layers): BLAKE2b is roughly twice as fast as SHA-256
+# on long strings and 128 bits is plenty for cache partitioning. Any
+# edit to a prompt changes its version and invalidates stale entries.
+PROMPT_VERSION = {
+    role: hashlib.blake2b(prompt_bytes, digest_size=16).hexdigest()
+    for role, prompt_bytes in _PROMPT_BYTES.items()
+}
+
+
 # Helper function to get appropriate prompt
+@functools.cache
 def get_system_prompt(role: str = "agent") -> str:
     """
     Get the appropriate system prompt for a given role.
@@ -470,11 +293,262 @@ def get_system_prompt(role: str = "agent") -> str:
     Returns:
         System prompt string
     """
-    prompts = {
-        "agent": AGENT_SYSTEM_PROMPT,
-        "planner": PLANNER_SYSTEM_PROMPT,
-        "picker": PICKER_SYSTEM_PROMPT,
-        "verifier": VERIFIER_SYSTEM_PROMPT
-    }
-    
-    return prompts.get(role, AGENT_SYSTEM_PROMPT)
+    return _PROMPTS.get(role, AGENT_SYSTEM_PROMPT)
+
+
+def get_system_prompt_bytes(role: str = "agent") -> bytes:
+    """
+    Get a role's system prompt pre-encoded as UTF-8 bytes.
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+
+    Returns:
+        System prompt bytes (shared module-level object, do not mutate)
+    """
+    return _PROMPT_BYTES.get(role, _PROMPT_BYTES["agent"])
+
+
+@functools.lru_cache(maxsize=None)
+def get_system_prompt_tokens(role: str = "agent",
+                             encoding: str = "cl100k_base") -> array.array:
+    """
+    Get a role's system prompt pre-tokenized as an int token-id array.
+
+    Self-hosted servers (vLLM, llama.cpp) re-run BPE over the full system
+    prompt on every request; tokenizing once per process and passing the
+    ids directly (e.g. vLLM prompt_token_ids) skips that work. Cached per
+    (role, encoding), so the 1-2k merge steps run once.
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+        encoding: tiktoken encoding name
+
+    Returns:
+        array.array('i') of token ids (shared cached object, do not mutate)
+
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "tiktoken is required for prompt pre-tokenization. "
+            "Install with: pip install tiktoken"
+        )
+
+    enc = tiktoken.get_encoding(encoding)
+    return array.array('i', enc.encode(get_system_prompt(role)))
+
+
+def kv_cache_path(role: str, cache_dir: str) -> Path:
+    """
+    Deterministic path for a role's persisted prompt KV state, keyed by
+    the prompt's content version so an edited prompt never reuses stale
+    attention state.
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        Path of the form prompt-cache-{role}-{version}.bin
+    """
+    return Path(cache_dir) / f"prompt-cache-{role}-{PROMPT_VERSION[role]}.bin"
+
+
+def persist_kv_cache(role: str, llm, cache_dir: str) -> Path:
+    """
+    Prefill a llama.cpp-style model with a role's system prompt and
+    persist the resulting KV state to disk.
+
+    On-prem models re-prefill the 1-2k-token system prompt on every cold
+    start; saving the state once lets later processes restore it instead
+    of recomputing (the equivalent of llama.cpp's --prompt-cache).
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+        llm: llama_cpp.Llama-compatible model (tokenize/eval/save_state)
+        cache_dir: Directory for cache files (created if missing)
+
+    Returns:
+        Path of the written (or already present) cache file
+    """
+    import pickle
+
+    path = kv_cache_path(role, cache_dir)
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    llm.reset()
+    llm.eval(llm.tokenize(get_system_prompt_bytes(role)))
+    with open(path, 'wb') as f:
+        pickle.dump(llm.save_state(), f)
+    return path
+
+
+def load_kv_cache(role: str, llm, cache_dir: str) -> bool:
+    """
+    Restore a role's persisted prompt KV state into a model, if present.
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+        llm: llama_cpp.Llama-compatible model (load_state)
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        True if a matching cache file was loaded, False otherwise
+    """
+    import pickle
+
+    path = kv_cache_path(role, cache_dir)
+    if not path.exists():
+        return False
+
+    with open(path, 'rb') as f:
+        llm.load_state(pickle.load(f))
+    return True
+
+
+def get_system_prompt_blocks(role: str = "agent",
+                             dynamic: str = "",
+                             provider: str = "anthropic") -> list:
+    """
+    Get a role's system prompt as provider message blocks, with the static
+    prompt text marked for prompt caching where the provider supports it.
+
+    The role prompts in this module never change at runtime, so the static
+    block is charged full input tokens only on the first call; any
+    request-specific text goes in a separate trailing block so it never
+    breaks the cached prefix.
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+        dynamic: Optional request-specific suffix text
+        provider: "anthropic" (text blocks with cache_control), "bedrock"
+                  (Converse content with a cachePoint marker), or "openai"
+                  (system messages; prefix caching is automatic)
+
+    Returns:
+        List of message block dictionaries in the provider's shape
+    """
+    static = get_system_prompt(role)
+
+    if provider == "openai":
+        # OpenAI caches byte-identical prefixes automatically; the static
+        # system message just has to come first and stay byte-stable
+        blocks = [{"role": "system", "content": static}]
+        if dynamic:
+            blocks.append({"role": "system", "content": dynamic})
+        return blocks
+
+    if provider == "bedrock":
+        blocks = [
+            {"text": static},
+            {"cachePoint": {"type": "default"}}
+        ]
+        if dynamic:
+            blocks.append({"text": dynamic})
+        return blocks
+
+    # Default: Anthropic-style text blocks
+    blocks = [{
+        "type": "text",
+        "text": static,
+        "cache_control": {"type": "ephemeral"}
+    }]
+    if dynamic:
+        blocks.append({"type": "text", "text": dynamic})
+    return blocks
+
+
+def iter_batch_requests(role: str,
+                        items,
+                        model: str,
+                        provider: str = "anthropic",
+                        max_tokens: int = 4096):
+    """
+    Yield batch-API request rows pairing a role's static system prompt
+    with per-item user content.
+
+    Picker-style workloads (many candidate sets against many beats) are
+    naturally batchable, and provider batch APIs cost half the streaming
+    price. Every row shares the same system blocks object, so the static
+    prompt is serialized identically per line and prefix caching applies
+    to non-batched retries as well.
+
+    Args:
+        role: One of "agent", "planner", "picker", "verifier"
+        items: Iterable of user-message strings, or (custom_id, text) pairs
+        model: Model identifier for the batch rows
+        provider: "anthropic" (Message Batches shape) or "openai" (Batch
+                  API shape with method/url/body)
+        max_tokens: max_tokens for Anthropic rows
+
+    Yields:
+        Request row dictionaries ready for json.dumps, one per item
+    """
+    system_blocks = get_system_prompt_blocks(role, provider=provider)
+
+    for i, item in enumerate(items):
+        if isinstance(item, tuple):
+            custom_id, text = item
+        else:
+            custom_id, text = f"{role}-{i}", item
+
+        if provider == "openai":
+            yield {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": system_blocks + [
+                        {"role": "user", "content": text}
+                    ]
+                }
+            }
+        else:
+            yield {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "system": system_blocks,
+                    "messages": [{"role": "user", "content": text}]
+                }
+            }
+
+
+def write_batch_file(path: str,
+                     role: str,
+                     items,
+                     model: str,
+                     provider: str = "anthropic",
+                     max_tokens: int = 4096) -> int:
+    """
+    Stream batch request rows to a JSONL file without holding the whole
+    batch in memory.
+
+    Args:
+        path: Output JSONL file path
+        role: One of "agent", "planner", "picker", "verifier"
+        items: Iterable of user-message strings, or (custom_id, text) pairs
+        model: Model identifier for the batch rows
+        provider: "anthropic" or "openai"
+        max_tokens: max_tokens for Anthropic rows
+
+    Returns:
+        Number of rows written
+    """
+    import json
+
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in iter_batch_requests(role, items, model, provider, max_tokens):
+            f.write(json.dumps(row))
+            f.write('\n')
+            count += 1
+    return count
@@ -0,0 +1,149 @@
+"""
+Verification Cache Module
+
+Caches verifier LLM results keyed by the formatted verification context.
+Exact repeats hit a SHA-256 lookup; near-identical contexts (same brief,
+minor shot reshuffle) hit a semantic layer that compares sentence
+embeddings against a cosine-similarity threshold, skipping a full LLM
+inference on every hit.
+"""
+
+import copy
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class VerificationCache:
+    """LRU cache of verification results with exact and semantic lookup."""
+
+    def __init__(self,
+                 similarity_threshold: float = 0.87,
+                 max_entries: int = 128,
+                 model_name: str = 'all-MiniLM-L6-v2'):
+        """
+        Initialize verification cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum cached verifications (LRU eviction)
+            model_name: sentence-transformers model for context embeddings
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+
+        # digest -> (embedding or None, verification dict)
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+
+        # Embedder loads lazily on first use; if unavailable the cache
+        # degrades to exact-match only rather than failing verification
+        self._model = None
+        self._model_failed = False
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(context: str) -> str:
+        """SHA-256 digest of a context string for exact lookup."""
+        return hashlib.sha256(context.encode('utf-8')).hexdigest()
+
+    def _embed(self, context: str) -> Optional[np.ndarray]:
+        """
+        Embed a context string as a normalized float32 vector, or None
+        if the embedding model cannot be loaded.
+        """
+        if self._model_failed:
+            return None
+
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name)
+                logger.info(f"[VERIFICATION_CACHE] Loaded embedder: {self.model_name}")
+            except Exception as e:
+                logger.warning(f"[VERIFICATION_CACHE] Embedder unavailable, "
+                               f"exact-match only: {e}")
+                self._model_failed = True
+                return None
+
+        vector = self._model.encode(context, convert_to_numpy=True)
+        vector = vector.astype(np.float32)
+        return vector / (np.linalg.norm(vector) + 1e-8)
+
+    def get(self, context: str) -> Optional[Dict]:
+        """
+        Look up a cached verification for a context.
+
+        Args:
+            context: Formatted verification context
+
+        Returns:
+            Deep copy of the cached verification dict, or None on miss
+        """
+        digest = self._digest(context)
+
+        # Exact match: zero-cost hit, no embedding needed
+        entry = self._entries.get(digest)
+        if entry is not None:
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            logger.info("[VERIFICATION_CACHE] ✓ Exact cache hit")
+            return copy.deepcopy(entry[1])
+
+        if not self._entries:
+            self.misses += 1
+            return None
+
+        # Semantic match against stored embeddings
+        query = self._embed(context)
+        if query is not None:
+            best_sim = -1.0
+            best_key = None
+            for key, (embedding, _) in self._entries.items():
+                if embedding is None:
+                    continue
+                sim = float(np.dot(embedding, query))
+                if sim > best_sim:
+                    best_sim = sim
+                    best_key = key
+
+            if best_key is not None and best_sim >= self.similarity_threshold:
+                self._entries.move_to_end(best_key)
+                self.hits += 1
+                logger.info(f"[VERIFICATION_CACHE] ✓ Semantic cache hit "
+                            f"(similarity {best_sim:.3f})")
+                return copy.deepcopy(self._entries[best_key][1])
+
+        self.misses += 1
+        return None
+
+    def put(self, context: str, verification: Dict):
+        """
+        Store a verification result for a context.
+
+        Args:
+            context: Formatted verification context
+            verification: Verification dictionary to cache
+        """
+        digest = self._digest(context)
+        embedding = self._embed(context)
+        self._entries[digest] = (embedding, copy.deepcopy(verification))
+        self._entries.move_to_end(digest)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        """Return cache statistics."""
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses
+        }
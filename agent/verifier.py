@@ -5,12 +5,15 @@ Reviews compiled edits for quality, standards compliance, and narrative flow.
 Provides feedback and suggestions for improvement.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 import json
 
 from agent.llm_client import ClaudeClient
 from agent.system_prompts import get_system_prompt
+from agent.verification_cache import VerificationCache
 
 # Configure logging
 logging.basicConfig(
@@ -19,32 +22,108 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matches the first fenced JSON block in one pass; re.S lets the object
+# span multiple lines
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+
+# Decision-critical fields scanned while a response is still streaming.
+# The text may be the raw API envelope, so quotes can arrive escaped;
+# callers normalize \" to " before matching.
+_APPROVED_FALSE_RE = re.compile(r'"approved"\s*:\s*false')
+_OVERALL_SCORE_RE = re.compile(r'"overall_score"\s*:\s*(\d+)')
+_HIGH_SEVERITY_RE = re.compile(r'"severity"\s*:\s*"high"')
+
+# Constant head and tail of every verification context; built once at
+# import so _format_verification_context only assembles the per-edit body
+_CONTEXT_HEADER = """# Edit Verification Task
+
+## Editorial Brief
+"""
+
+_CRITERIA_AND_SCHEMA_TEMPLATE = """## Verification Criteria
+
+Evaluate the edit on these dimensions:
+
+1. **Narrative Flow** (1-10)
+   - Does the story flow logically?
+   - Are transitions smooth?
+   - Is the pacing appropriate?
+
+2. **Brief Compliance** (1-10)
+   - Does it match the editorial brief?
+   - Are key points covered?
+   - Is the tone appropriate?
+
+3. **Technical Quality** (1-10)
+   - Are shot types used appropriately?
+   - Is duration within target?
+   - Are there technical issues?
+
+4. **Broadcast Standards** (1-10)
+   - Does it meet broadcast standards?
+   - Is it balanced and fair?
+   - Are there any compliance issues?
+
+## Task
+Provide a comprehensive verification report as JSON:
+```json
+{
+  "overall_score": 8,
+  "scores": {
+    "narrative_flow": 8,
+    "brief_compliance": 9,
+    "technical_quality": 7,
+    "broadcast_standards": 8
+  },
+  "strengths": ["List of strengths"],
+  "issues": [
+    {
+      "severity": "high|medium|low",
+      "category": "narrative|technical|compliance",
+      "description": "Issue description",
+      "suggestion": "How to fix"
+    }
+  ],
+  "recommendations": ["List of recommendations"],
+  "approved": true
+}
+```"""
+
 
 class Verifier:
     """Verifies edit quality and compliance."""
     
-    def __init__(self, llm_client: ClaudeClient):
+    def __init__(self, llm_client: ClaudeClient, enable_cache: bool = True):
         """
         Initialize verifier.
-        
+
         Args:
             llm_client: LLM client for inference
+            enable_cache: Cache verification results by context (exact and
+                          semantic match), skipping repeat LLM calls
         """
         self.llm_client = llm_client
+        self.cache = VerificationCache() if enable_cache else None
         logger.info("[VERIFIER] Initialized")
     
     def verify_edit(self,
                    plan: Dict,
                    selections: Dict,
-                   brief: str) -> Dict:
+                   brief: str,
+                   early_stop: bool = False) -> Dict:
         """
         Verify a compiled edit for quality and compliance.
-        
+
         Args:
             plan: Story plan dictionary
             selections: Shot selections dictionary
             brief: Original editorial brief
-            
+            early_stop: Stream the response and stop downloading once a
+                        rejection signal (approved false or a high-
+                        severity issue) plus a score have arrived; the
+                        returned verification is then partial and marked
+                        'truncated'
+
         Returns:
             Dictionary with verification results
         """
@@ -55,32 +134,282 @@ class Verifier:
         
         # Format context for LLM
         context = self._format_verification_context(plan, selections, brief)
-        
+
+        # Check the cache before paying for an LLM inference
+        if self.cache is not None:
+            cached = self.cache.get(context)
+            if cached is not None:
+                return cached
+
         # Call LLM to verify
         logger.info("[VERIFIER] Calling LLM to verify edit...")
-        
+
         try:
-            response = self.llm_client.chat(
-                query=context,
-                module='verifier'
-            )
-            
+            if early_stop and hasattr(self.llm_client, 'chat_stream'):
+                response = self.llm_client.chat_stream(
+                    query=context,
+                    module='verifier',
+                    should_stop=self._decision_ready
+                )
+            else:
+                response = self.llm_client.chat(
+                    query=context,
+                    module='verifier'
+                )
+
             # Extract content from response
             response_text = response.get('content', response)
-            
-            # Parse response
-            verification = self._parse_verification_response(response_text, plan, selections)
-            
+
+            # Parse response; an aborted stream yields a partial body
+            if response.get('truncated'):
+                verification = self._partial_verification(response_text, plan, selections)
+            else:
+                verification = self._parse_verification_response(response_text, plan, selections)
+
             logger.info(f"[VERIFIER] ✓ Verification complete")
             logger.info(f"[VERIFIER] Overall Score: {verification.get('overall_score', 'N/A')}/10")
             logger.info(f"[VERIFIER] Issues Found: {len(verification.get('issues', []))}")
-            
+
+            # Partial (truncated) results are never cached
+            if (self.cache is not None and 'error' not in verification
+                    and not verification.get('truncated')):
+                self.cache.put(context, verification)
+
             return verification
-            
+
         except Exception as e:
             logger.error(f"[VERIFIER] ✗ Verification failed: {e}")
             raise
-    
+
+    @staticmethod
+    def _decision_ready(text: str) -> bool:
+        """
+        Whether streamed response text already settles the verdict:
+        a score has arrived together with either an explicit rejection
+        or a high-severity issue.
+
+        Args:
+            text: Response text received so far (may be the raw API
+                  envelope with escaped quotes)
+
+        Returns:
+            True if downloading the rest of the response can be skipped
+        """
+        normalized = text.replace('\\"', '"')
+        if not _OVERALL_SCORE_RE.search(normalized):
+            return False
+        return bool(_APPROVED_FALSE_RE.search(normalized)
+                    or _HIGH_SEVERITY_RE.search(normalized))
+
+    def _partial_verification(self,
+                              response: str,
+                              plan: Dict,
+                              selections: Dict) -> Dict:
+        """
+        Build a verification dict from a partially downloaded response.
+
+        Only the decision-critical fields are recovered; the result is
+        marked 'truncated' and treated as a rejection.
+
+        Args:
+            response: Partial response text
+            plan: Story plan
+            selections: Shot selections
+
+        Returns:
+            Structured verification dictionary with 'truncated': True
+        """
+        normalized = response.replace('\\"', '"')
+
+        score_match = _OVERALL_SCORE_RE.search(normalized)
+        overall_score = int(score_match.group(1)) if score_match else 0
+        high_count = len(_HIGH_SEVERITY_RE.findall(normalized))
+
+        # Distinct dicts per issue — downstream annotation mutates them
+        issues = [
+            {
+                'severity': 'high',
+                'category': 'unknown',
+                'description': 'High-severity issue reported before stream was cut short',
+                'suggestion': 'Re-run full verification for details'
+            }
+            for _ in range(high_count)
+        ]
+
+        logger.info(f"[VERIFIER] Early rejection: score {overall_score}, "
+                    f"{high_count} high-severity issue(s) seen before abort")
+
+        return {
+            'plan': plan,
+            'selections': selections,
+            'overall_score': overall_score,
+            'scores': {},
+            'strengths': [],
+            'issues': issues,
+            'high_severity_issues': list(issues),
+            'medium_severity_issues': [],
+            'low_severity_issues': [],
+            'recommendations': [],
+            'approved': False,
+            'truncated': True,
+            'raw_response': response
+        }
+
+    async def verify_edit_async(self,
+                                plan: Dict,
+                                selections: Dict,
+                                brief: str) -> Dict:
+        """
+        Async variant of verify_edit for concurrent verification.
+
+        Args:
+            plan: Story plan dictionary
+            selections: Shot selections dictionary
+            brief: Original editorial brief
+
+        Returns:
+            Dictionary with verification results
+        """
+        logger.info("[VERIFIER] Verifying edit (async)...")
+
+        context = self._format_verification_context(plan, selections, brief)
+
+        if self.cache is not None:
+            cached = self.cache.get(context)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self.llm_client.achat(
+                query=context,
+                module='verifier'
+            )
+
+            response_text = response.get('content', response)
+            verification = self._parse_verification_response(response_text, plan, selections)
+
+            logger.info("[VERIFIER] ✓ Verification complete")
+            logger.info("[VERIFIER] Overall Score: %s/10",
+                        verification.get('overall_score', 'N/A'))
+
+            if self.cache is not None and 'error' not in verification:
+                self.cache.put(context, verification)
+
+            return verification
+
+        except Exception as e:
+            logger.error(f"[VERIFIER] ✗ Verification failed: {e}")
+            raise
+
+    async def verify_full(self,
+                          plan: Dict,
+                          selections: Dict,
+                          brief: str,
+                          target_duration: int,
+                          fail_fast: bool = False) -> Dict:
+        """
+        Run quick checks and LLM verification concurrently.
+
+        quick_check is cheap and independent of the LLM call, so both
+        start immediately; with fail_fast, a failed quick check cancels
+        the in-flight LLM request and returns the automated issues
+        alone, saving the inference.
+
+        Args:
+            plan: Story plan dictionary
+            selections: Shot selections dictionary
+            brief: Original editorial brief
+            target_duration: Target duration in seconds for quick checks
+            fail_fast: Skip LLM verification when quick checks fail
+
+        Returns:
+            Verification dictionary with quick-check issues merged in
+            (and 'llm_skipped': True when the LLM call was cancelled)
+        """
+        quick_task = asyncio.create_task(
+            asyncio.to_thread(self.quick_check, selections, target_duration)
+        )
+        llm_task = asyncio.create_task(
+            self.verify_edit_async(plan, selections, brief)
+        )
+
+        quick = await quick_task
+
+        if fail_fast and not quick['passed']:
+            llm_task.cancel()
+            try:
+                await llm_task
+            except asyncio.CancelledError:
+                pass
+
+            logger.info("[VERIFIER] Quick checks failed, skipping LLM verification")
+
+            quick_buckets = {'high': [], 'medium': [], 'low': []}
+            for issue in quick['issues']:
+                bucket = quick_buckets.get(issue.get('severity'))
+                if bucket is not None:
+                    bucket.append(issue)
+
+            return {
+                'plan': plan,
+                'selections': selections,
+                'overall_score': 0,
+                'scores': {},
+                'strengths': [],
+                'issues': list(quick['issues']),
+                'high_severity_issues': quick_buckets['high'],
+                'medium_severity_issues': quick_buckets['medium'],
+                'low_severity_issues': quick_buckets['low'],
+                'recommendations': [],
+                'approved': False,
+                'quick_check': quick,
+                'llm_skipped': True
+            }
+
+        verification = await llm_task
+        verification['quick_check'] = quick
+
+        # Merge automated issues alongside the LLM's findings
+        if quick['issues']:
+            verification['issues'] = verification.get('issues', []) + quick['issues']
+            for issue in quick['issues']:
+                bucket = verification.get(f"{issue.get('severity')}_severity_issues")
+                if bucket is not None:
+                    bucket.append(issue)
+
+        return verification
+
+    async def verify_batch(self,
+                           edits: List[Tuple[Dict, Dict, str]],
+                           max_concurrency: int = 4) -> List[Dict]:
+        """
+        Verify many edits concurrently.
+
+        LLM latency dominates verification, so N edits complete in
+        roughly the slowest single call instead of the sum; the
+        semaphore caps in-flight requests to respect provider rate
+        limits.
+
+        Args:
+            edits: List of (plan, selections, brief) tuples
+            max_concurrency: Maximum concurrent LLM requests
+
+        Returns:
+            Verification dictionaries in the same order as edits
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _verify_one(plan: Dict, selections: Dict, brief: str) -> Dict:
+            async with semaphore:
+                return await self.verify_edit_async(plan, selections, brief)
+
+        logger.info(f"[VERIFIER] Verifying {len(edits)} edits "
+                    f"(max {max_concurrency} concurrent)")
+        return await asyncio.gather(
+            *(_verify_one(plan, selections, brief)
+              for plan, selections, brief in edits)
+        )
+
     def _format_verification_context(self,
                                     plan: Dict,
                                     selections: Dict,
@@ -96,99 +425,55 @@ class Verifier:
         Returns:
             Formatted context string
         """
-        lines = []
-        
-        lines.append("# Edit Verification Task")
-        lines.append("")
-        lines.append("## Editorial Brief")
-        lines.append(brief)
-        lines.append("")
-        
-        lines.append("## Story Plan")
-        lines.append(f"Target Duration: {plan['target_duration']}s")
-        lines.append(f"Planned Duration: {plan['planned_duration']}s")
-        lines.append(f"Total Beats: {len(plan['beats'])}")
-        lines.append("")
-        
-        for beat in plan['beats']:
-            lines.append(f"### Beat {beat['beat_number']}: {beat['title']}")
-            lines.append(f"- Description: {beat['description']}")
-            lines.append(f"- Target Duration: {beat['target_duration']}s")
-            lines.append("")
-        
-        lines.append("## Compiled Edit")
-        lines.append(f"Total Shots: {selections['total_shots']}")
-        lines.append(f"Total Duration: {selections['total_duration']:.1f}s")
-        lines.append("")
-        
+        # Only the per-edit body is assembled here; the header, criteria
+        # and JSON schema are precomputed module-level constants
+        parts = [
+            _CONTEXT_HEADER + brief,
+            "",
+            "## Story Plan",
+            f"Target Duration: {plan['target_duration']}s",
+            f"Planned Duration: {plan['planned_duration']}s",
+            f"Total Beats: {len(plan['beats'])}",
+            "",
+        ]
+
+        parts.extend(
+            f"### Beat {beat['beat_number']}: {beat['title']}\n"
+            f"- Description: {beat['description']}\n"
+            f"- Target Duration: {beat['target_duration']}s\n"
+            for beat in plan['beats']
+        )
+
+        parts.extend([
+            "## Compiled Edit",
+            f"Total Shots: {selections['total_shots']}",
+            f"Total Duration: {selections['total_duration']:.1f}s",
+            "",
+        ])
+
         for beat_sel in selections['beat_selections']:
             beat = beat_sel['beat']
-            lines.append(f"### Beat {beat['beat_number']}: {beat['title']}")
-            lines.append(f"- Shots Selected: {len(beat_sel['shots'])}")
-            lines.append(f"- Duration: {beat_sel['duration']:.1f}s")
-            
+            block = [
+                f"### Beat {beat['beat_number']}: {beat['title']}",
+                f"- Shots Selected: {len(beat_sel['shots'])}",
+                f"- Duration: {beat_sel['duration']:.1f}s",
+            ]
+
             if beat_sel.get('reasoning'):
-                lines.append(f"- Reasoning: {beat_sel['reasoning']}")
-            
-            lines.append("")
-            
+                block.append(f"- Reasoning: {beat_sel['reasoning']}")
+
+            block.append("")
+
             for shot in beat_sel['shots']:
-                lines.append(f"  * Shot {shot['shot_id']}: {shot.get('duration', 0):.1f}s")
+                block.append(f"  * Shot {shot['shot_id']}: {shot.get('duration', 0):.1f}s")
                 if shot.get('reason'):
-                    lines.append(f"    Reason: {shot['reason']}")
-            
-            lines.append("")
-        
-        lines.append("## Verification Criteria")
-        lines.append("")
-        lines.append("Evaluate the edit on these dimensions:")
-        lines.append("")
-        lines.append("1. **Narrative Flow** (1-10)")
-        lines.append("   - Does the story flow logically?")
-        lines.append("   - Are transitions smooth?")
-        lines.append("   - Is the pacing appropriate?")
-        lines.append("")
-        lines.append("2. **Brief Compliance** (1-10)")
-        lines.append("   - Does it match the editorial brief?")
-        lines.append("   - Are key points covered?")
-        lines.append("   - Is the tone appropriate?")
-        lines.append("")
-        lines.append("3. **Technical Quality** (1-10)")
-        lines.append("   - Are shot types used appropriately?")
-        lines.append("   - Is duration within target?")
-        lines.append("   - Are there technical issues?")
-        lines.append("")
-        lines.append("4. **Broadcast Standards** (1-10)")
-        lines.append("   - Does it meet broadcast standards?")
-        lines.append("   - Is it balanced and fair?")
-        lines.append("   - Are there any compliance issues?")
-        lines.append("")
-        lines.append("## Task")
-        lines.append("Provide a comprehensive verification report as JSON:")
-        lines.append("```json")
-        lines.append("{")
-        lines.append('  "overall_score": 8,')
-        lines.append('  "scores": {')
-        lines.append('    "narrative_flow": 8,')
-        lines.append('    "brief_compliance": 9,')
-        lines.append('    "technical_quality": 7,')
-        lines.append('    "broadcast_standards": 8')
-        lines.append('  },')
-        lines.append('  "strengths": ["List of strengths"],')
-        lines.append('  "issues": [')
-        lines.append('    {')
-        lines.append('      "severity": "high|medium|low",')
-        lines.append('      "category": "narrative|technical|compliance",')
-        lines.append('      "description": "Issue description",')
-        lines.append('      "suggestion": "How to fix"')
-        lines.append('    }')
-        lines.append('  ],')
-        lines.append('  "recommendations": ["List of recommendations"],')
-        lines.append('  "approved": true')
-        lines.append('}')
-        lines.append("```")
-        
-        return "\n".join(lines)
+                    block.append(f"    Reason: {shot['reason']}")
+
+            block.append("")
+            parts.append("\n".join(block))
+
+        parts.append(_CRITERIA_AND_SCHEMA_TEMPLATE)
+        return "\n".join(parts)
     
     def _parse_verification_response(self,
                                     response: str,
@@ -206,17 +491,19 @@ class Verifier:
             Structured verification dictionary
         """
         try:
-            # Extract JSON
-            if "```json" in response:
-                start = response.find("```json") + 7
-                end = response.find("```", start)
-                json_str = response[start:end].strip()
-            elif "```" in response:
-                start = response.find("```") + 3
-                end = response.find("```", start)
-                json_str = response[start:end].strip()
+            # Extract JSON: single compiled-regex pass over the response
+            # instead of repeated substring scans
+            match = _JSON_BLOCK_RE.search(response)
+            if match:
+                json_str = match.group(1)
             else:
-                json_str = response.strip()
+                # Unfenced response: take the outermost braces if present
+                start = response.find('{')
+                end = response.rfind('}')
+                if start != -1 and end > start:
+                    json_str = response[start:end + 1]
+                else:
+                    json_str = response.strip()
             
             verification_data = json.loads(json_str)
             
@@ -233,20 +520,18 @@ class Verifier:
                 'raw_response': response
             }
             
-            # Categorize issues by severity
-            verification['high_severity_issues'] = [
-                i for i in verification['issues'] 
-                if i.get('severity') == 'high'
-            ]
-            verification['medium_severity_issues'] = [
-                i for i in verification['issues'] 
-                if i.get('severity') == 'medium'
-            ]
-            verification['low_severity_issues'] = [
-                i for i in verification['issues'] 
-                if i.get('severity') == 'low'
-            ]
-            
+            # Categorize issues by severity in a single pass; unknown
+            # severities land in no bucket, as before
+            buckets = {'high': [], 'medium': [], 'low': []}
+            for issue in verification['issues']:
+                bucket = buckets.get(issue.get('severity'))
+                if bucket is not None:
+                    bucket.append(issue)
+
+            verification['high_severity_issues'] = buckets['high']
+            verification['medium_severity_issues'] = buckets['medium']
+            verification['low_severity_issues'] = buckets['low']
+
             return verification
             
         except json.JSONDecodeError as e:
@@ -347,8 +632,8 @@ class Verifier:
                     })
         
         logger.info(f"[VERIFIER] Quick check found {len(issues)} issues")
-        
+
         return {
             'issues': issues,
-            'passed': len([i for i in issues if i['severity'] == 'high']) == 0
+            'passed': all(i['severity'] != 'high' for i in issues)
         }
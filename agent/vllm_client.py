@@ -0,0 +1,126 @@
+"""
+LLM Client for locally served models via vLLM
+
+Drop-in alternative to ClaudeClient for teams that control their own model
+serving. vLLM's continuous batching means N concurrent requests share a
+single forward pass at each decode step, so parallel planner/picker calls
+scale near-linearly instead of being serialized through a remote API.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Dict, Optional
+
+from .system_prompts import get_system_prompt
+
+logger = logging.getLogger(__name__)
+
+
+class VLLMClient:
+    """Client for a local vLLM AsyncLLMEngine, interface-compatible with ClaudeClient."""
+
+    def __init__(self,
+                 model: str = "meta-llama/Llama-3.1-8B-Instruct",
+                 temperature: float = 0.1,
+                 max_tokens: int = 4096):
+        """
+        Initialize vLLM client.
+
+        Args:
+            model: HuggingFace model identifier to serve locally
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate per request
+
+        Raises:
+            ImportError: If vllm is not installed
+        """
+        try:
+            from vllm import AsyncLLMEngine, AsyncEngineArgs, SamplingParams
+        except ImportError as e:
+            raise ImportError(
+                "vllm is required for VLLMClient. Install with: pip install vllm"
+            ) from e
+
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+
+        self._sampling_params_cls = SamplingParams
+        self.engine = AsyncLLMEngine.from_engine_args(
+            AsyncEngineArgs(model=model)
+        )
+
+        logger.info(f"[VLLM] Initialized with model: {model}, temperature: {temperature}")
+
+    def _build_prompt(self, query: str, context: Optional[str], module: Optional[str]) -> str:
+        """Combine system prompt, context, and query into a single prompt."""
+        parts = [get_system_prompt(module or "agent")]
+        if context:
+            parts.append(context)
+        parts.append(query)
+        return "\n\n".join(parts)
+
+    async def achat(self,
+                    query: str,
+                    workflow_id: Optional[str] = None,
+                    context: Optional[str] = None,
+                    module: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send an inference request to the local vLLM engine.
+
+        Concurrent calls are continuously batched by the engine, so callers
+        should prefer asyncio.gather over sequential awaits.
+
+        Args:
+            query: The user query/prompt
+            workflow_id: Ignored (Open Arena concept, kept for interface parity)
+            context: Optional context string
+            module: Optional module name ('planner', 'picker', 'verifier')
+                    used to select the system prompt
+
+        Returns:
+            Response dictionary with 'content', 'usage', etc.
+        """
+        prompt = self._build_prompt(query, context, module)
+
+        sampling_params = self._sampling_params_cls(
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+
+        request_id = uuid.uuid4().hex
+        logger.info(f"[VLLM] REQUEST {request_id} ({len(prompt)} chars)")
+
+        # generate() returns an async iterator of partial outputs; the last
+        # item holds the complete generation
+        final_output = None
+        async for output in self.engine.generate(prompt, sampling_params, request_id):
+            final_output = output
+
+        content = final_output.outputs[0].text if final_output else ""
+
+        logger.info(f"[VLLM] Response received ({len(content)} chars)")
+
+        return {
+            "content": content,
+            "usage": {
+                "prompt_tokens": len(final_output.prompt_token_ids) if final_output else 0,
+                "completion_tokens": len(final_output.outputs[0].token_ids) if final_output else 0
+            },
+            "model": self.model,
+            "raw_response": final_output
+        }
+
+    def chat(self,
+             query: str,
+             workflow_id: Optional[str] = None,
+             context: Optional[str] = None,
+             module: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around achat for ClaudeClient compatibility.
+
+        Note: Sequential chat() calls do not benefit from continuous
+        batching; use achat with asyncio.gather for parallel workloads.
+        """
+        return asyncio.run(self.achat(query, workflow_id, context, module))
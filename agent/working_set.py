@@ -6,23 +6,131 @@ Uses vector similarity search and shot graph traversal to find relevant content.
 """
 
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 import yaml
 from pathlib import Path
+from sklearn.feature_extraction.text import CountVectorizer
 
+from agent._ws_numba import expand_temporal_neighbors
 from storage.database import ShotsDatabase
 from storage.vector_index import VectorIndex
 from ingest.embedder import Embedder
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging configuration belongs to the entry points (cli, api server);
+# configuring it at import time double-registers handlers in workers
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_default_config() -> Dict:
+    """Parse config.yaml once per process; the config is read-only."""
+    config_path = Path(__file__).parent.parent / 'config.yaml'
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def _top_k_desc(scores: np.ndarray, k: Optional[int]) -> np.ndarray:
+    """
+    Indices of the k largest scores in stable descending order.
+
+    Equivalent to np.argsort(-scores, kind='stable')[:k] but O(N + K log K):
+    an argpartition narrows the field to K candidates, ties at the cutoff
+    resolve toward lower indices (matching stable-sort selection), and
+    only the survivors are sorted.
+
+    Args:
+        scores: Score array
+        k: Number of results, or None for a full descending sort
+
+    Returns:
+        int64 index array of length min(k, scores.size)
+    """
+    n = scores.size
+    if k is not None and k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind='stable')
+
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    threshold = scores[candidates].min()
+
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - above.size]
+    chosen = np.concatenate((above, ties))
+
+    return chosen[np.argsort(-scores[chosen], kind='stable')]
+
+
+@dataclass
+class ShotArrays:
+    """
+    Struct-of-arrays view over a list of shot dictionaries.
+
+    Hot paths (scoring, sorting, statistics) scan contiguous NumPy
+    arrays instead of probing dict keys per shot; the original dicts
+    stay attached as shots for everything that needs string fields.
+    """
+    shots: List[Dict]
+    ids: np.ndarray            # int64 shot IDs
+    durations_ms: np.ndarray   # float64 durations in milliseconds
+    capture_ts: np.ndarray     # float64 capture timestamps
+    shot_type_codes: np.ndarray  # int16 indices into shot_types
+    shot_types: Tuple          # shot-type vocabulary, code order
+    has_face: np.ndarray       # bool per shot
+
+    @classmethod
+    def from_shots(cls, shots: List[Dict]) -> 'ShotArrays':
+        """Build the array view from shot dictionaries."""
+        n = len(shots)
+        vocab: Dict[Any, int] = {}
+        codes = np.empty(n, np.int16)
+        for i, shot in enumerate(shots):
+            shot_type = shot.get('shot_type', 'UNKNOWN')
+            codes[i] = vocab.setdefault(shot_type, len(vocab))
+
+        return cls(
+            shots=shots,
+            ids=np.fromiter((s['shot_id'] for s in shots),
+                            dtype=np.int64, count=n),
+            durations_ms=np.fromiter((s['duration_ms'] for s in shots),
+                                     dtype=np.float64, count=n),
+            capture_ts=np.fromiter((s['capture_ts'] for s in shots),
+                                   dtype=np.float64, count=n),
+            shot_type_codes=codes,
+            shot_types=tuple(vocab),
+            has_face=np.fromiter((bool(s.get('has_face')) for s in shots),
+                                 dtype=np.bool_, count=n),
+        )
+
+    @property
+    def is_sot(self) -> np.ndarray:
+        """Boolean mask of SOT shots."""
+        try:
+            sot_code = self.shot_types.index('SOT')
+        except ValueError:
+            return np.zeros(self.shot_type_codes.size, np.bool_)
+        return self.shot_type_codes == sot_code
+
+    def duration_seconds(self) -> np.ndarray:
+        """Per-shot durations in seconds."""
+        return self.durations_ms / 1000.0
+
+    def shot_type_counts(self) -> Dict:
+        """Count of shots per shot type."""
+        counts = np.bincount(self.shot_type_codes,
+                             minlength=len(self.shot_types))
+        return {shot_type: int(count)
+                for shot_type, count in zip(self.shot_types, counts)}
+
+
 class WorkingSetBuilder:
     """Builds focused working sets of shots for agent processing."""
     
@@ -40,13 +148,35 @@ class WorkingSetBuilder:
         
         # Load config if not provided
         if config is None:
-            config_path = Path(__file__).parent.parent / 'config.yaml'
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _load_default_config()
         
         self.config = config
         self.embedder = Embedder(config)
-        
+
+        # Per-story caches survive across beat calls — shots only change
+        # on ingest, which invalidates them through the database change
+        # listener. The shots cache additionally carries a short TTL as a
+        # backstop against writers that bypass this process.
+        self._capture_order_cache: 'OrderedDict[Tuple, Tuple[Tuple[int, ...], Dict[int, int]]]' = OrderedDict()
+        self._capture_order_cache_size = 8
+        self._story_shots_cache: 'OrderedDict[Tuple, Tuple[float, List[Dict]]]' = OrderedDict()
+        self._story_shots_cache_size = 8
+        self._story_shots_ttl = 60.0
+
+        # Query embeddings are deterministic per text, so repeat queries
+        # (retried beats, recurring briefs) skip the model forward pass
+        self._query_embedding_cache: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._query_embedding_cache_size = 1024
+
+        # build_for_beats fans builds out across a thread pool and the
+        # API layer calls into the same builder concurrently, so every
+        # cache read/mutate pair happens under one lock (same pattern
+        # as api.query_cache). DB fetches and model forward passes stay
+        # outside the lock.
+        self._cache_lock = threading.RLock()
+        if hasattr(self.database, 'add_change_listener'):
+            self.database.add_change_listener(self._invalidate_story_caches)
+
         logger.info("[WORKING_SET] Initialized with semantic search capabilities")
     
     def build_for_query(self,
@@ -54,22 +184,29 @@ class WorkingSetBuilder:
                        query: str,
                        max_shots: int = 50,
                        shot_types: Optional[List[str]] = None,
-                       include_neighbors: bool = True) -> Dict:
+                       include_neighbors: bool = True,
+                       query_embedding: Optional[np.ndarray] = None,
+                       search_results: Optional[List] = None) -> Dict:
         """
         Build a working set based on a text query.
-        
+
         Args:
             story_slug: Story identifier
             query: Text query describing desired content
             max_shots: Maximum number of shots to include
             shot_types: Optional filter for shot types
             include_neighbors: Whether to include temporal neighbors
-            
+            query_embedding: Precomputed embedding for query (skips the
+                             per-call embed; used by batch callers)
+            search_results: Precomputed vector search results for query
+                            (skips both embed and index search; used by
+                            batch callers)
+
         Returns:
             Dictionary with working set metadata and shots
         """
-        logger.info(f"[WORKING_SET] Building for query: '{query}'")
-        logger.info(f"[WORKING_SET] Story: {story_slug}, max_shots: {max_shots}")
+        logger.debug(f"[WORKING_SET] Building for query: '{query}'")
+        logger.debug(f"[WORKING_SET] Story: {story_slug}, max_shots: {max_shots}")
         
         working_set = {
             'story_slug': story_slug,
@@ -81,82 +218,93 @@ class WorkingSetBuilder:
             'shot_type_counts': {}
         }
         
-        # Step 1: Get all shots for story
-        all_shots = self.database.get_shots_by_story(
-            story_slug,
-            shot_types=shot_types
-        )
+        # Step 1: Get all shots for story (cached across beat builds)
+        all_shots = self._get_story_shots(story_slug, shot_types)
         
         if not all_shots:
             logger.warning(f"[WORKING_SET] No shots found for story {story_slug}")
             return working_set
         
-        logger.info(f"[WORKING_SET] Found {len(all_shots)} total shots")
+        logger.debug(f"[WORKING_SET] Found {len(all_shots)} total shots")
         
         # Step 2: Perform vector similarity search with semantic embeddings
         try:
-            # Generate query embedding
-            query_embedding = self.embedder.embed_text([query])[0]
-            
-            # Search vector index (get 2x candidates for hybrid filtering)
-            search_results = self.vector_index.search(
-                query_vector=query_embedding,
-                k=min(max_shots * 2, len(all_shots))
-            )
-            
-            if search_results:
-                logger.info(f"[WORKING_SET] Semantic search found {len(search_results)} candidates")
-                
-                # Get full shot details for semantic search results
-                semantic_shot_ids = [r.shot_id for r in search_results]
-                semantic_shots = self.database.get_shots_by_ids(semantic_shot_ids)
-                
-                # Create score map from search results
-                semantic_score_map = {r.shot_id: r.score for r in search_results}
-                
-                # Add semantic scores to shots
+            if search_results is None:
+                # Generate query embedding unless the caller already has one
+                if query_embedding is None:
+                    query_embedding = self._embed_queries([query])[query]
+
+                # Restrict the walk to this story's shots inside the
+                # index, so every hit is usable and a small over-fetch
+                # margin for hybrid rescoring replaces the old 3x one
+                search_results = self.vector_index.search(
+                    query_vector=query_embedding,
+                    k=min(max_shots + 10, self.vector_index.size()),
+                    allowed_ids=[shot['shot_id'] for shot in all_shots]
+                )
+
+            # Merge similarities into the story shots already in memory.
+            # This avoids a second database round trip and confines the
+            # results to this story (the index spans all stories)
+            semantic_score_map = {r.shot_id: r.score for r in search_results}
+            semantic_shots = [
+                shot for shot in all_shots
+                if shot['shot_id'] in semantic_score_map
+            ]
+
+            if semantic_shots:
+                logger.debug(f"[WORKING_SET] Semantic search found {len(semantic_shots)} candidates")
+
                 for shot in semantic_shots:
-                    shot['semantic_score'] = semantic_score_map.get(shot['shot_id'], 0.0)
-                
+                    shot['semantic_score'] = semantic_score_map[shot['shot_id']]
+
                 # Step 3: Apply hybrid scoring (semantic + keyword + heuristics)
-                scored_shots = self._apply_hybrid_scoring(semantic_shots, query)
-                
+                scored_shots = self._apply_hybrid_scoring(semantic_shots, query,
+                                                          top_k=max_shots)
+
             else:
                 logger.warning("[WORKING_SET] Semantic search returned no results, falling back to keyword matching")
-                scored_shots = self._score_shots(all_shots, query)
+                scored_shots = self._score_shots(all_shots, query, top_k=max_shots)
                 
         except Exception as e:
             logger.warning(f"[WORKING_SET] Semantic search failed ({e}), falling back to keyword matching")
-            scored_shots = self._score_shots(all_shots, query)
+            scored_shots = self._score_shots(all_shots, query, top_k=max_shots)
         
         # Step 4: Select top shots
         selected_shots = scored_shots[:max_shots]
         
         # Step 5: Add temporal neighbors if requested
         if include_neighbors:
+            capture_order, capture_positions = self._capture_order(
+                story_slug, shot_types, all_shots
+            )
             selected_shots = self._add_temporal_neighbors(
                 selected_shots,
                 all_shots,
-                max_total=max_shots
+                max_total=max_shots,
+                capture_order=capture_order,
+                capture_positions=capture_positions
             )
         
-        # Step 6: Sort by capture time
-        selected_shots.sort(key=lambda s: s['capture_ts'])
-        
-        # Step 7: Calculate statistics
+        # Steps 6-7: Sort by capture time and calculate statistics over
+        # the array view rather than per-shot dict probes
+        arrays = ShotArrays.from_shots(selected_shots)
+        order = np.argsort(arrays.capture_ts, kind='stable')
+
+        # The _asr_tokens memo is scoring plumbing; drop it from the
+        # shots we hand back so it never reaches API responses
+        selected_shots = [
+            {k: v for k, v in selected_shots[i].items() if k != '_asr_tokens'}
+            for i in order
+        ]
+
         working_set['shots'] = selected_shots
-        working_set['total_duration'] = sum(
-            s['duration_ms'] / 1000.0 for s in selected_shots
-        )
+        working_set['total_duration'] = float(arrays.durations_ms.sum()) / 1000.0
+        working_set['shot_type_counts'] = arrays.shot_type_counts()
         
-        for shot in selected_shots:
-            shot_type = shot.get('shot_type', 'UNKNOWN')
-            working_set['shot_type_counts'][shot_type] = \
-                working_set['shot_type_counts'].get(shot_type, 0) + 1
-        
-        logger.info(f"[WORKING_SET] Selected {len(selected_shots)} shots")
-        logger.info(f"[WORKING_SET] Total duration: {working_set['total_duration']:.1f}s")
-        logger.info(f"[WORKING_SET] Shot types: {working_set['shot_type_counts']}")
+        logger.debug(f"[WORKING_SET] Selected {len(selected_shots)} shots")
+        logger.debug(f"[WORKING_SET] Total duration: {working_set['total_duration']:.1f}s")
+        logger.debug(f"[WORKING_SET] Shot types: {working_set['shot_type_counts']}")
         
         return working_set
     
@@ -177,7 +325,7 @@ class WorkingSetBuilder:
         Returns:
             Dictionary with working set for the beat
         """
-        logger.info(f"[WORKING_SET] Building for beat: '{beat_description}'")
+        logger.debug(f"[WORKING_SET] Building for beat: '{beat_description}'")
         
         # Combine description and requirements into query
         query = f"{beat_description}. Requirements: {', '.join(beat_requirements)}"
@@ -192,10 +340,194 @@ class WorkingSetBuilder:
         
         working_set['beat_description'] = beat_description
         working_set['beat_requirements'] = beat_requirements
-        
+
         return working_set
-    
-    def _apply_hybrid_scoring(self, shots: List[Dict], query: str) -> List[Dict]:
+
+    def build_for_beats(self,
+                        story_slug: str,
+                        beats: List[Dict],
+                        max_shots: int = 20) -> List[Dict]:
+        """
+        Build working sets for all beats of a plan at once.
+
+        Embedding dominates per-beat cost and batches well, so all beat
+        queries are embedded in one model call (deduplicated by exact
+        text) instead of one embed per build_for_beat.
+
+        Args:
+            story_slug: Story identifier
+            beats: Beat dictionaries with 'description' and 'requirements'
+            max_shots: Maximum candidate shots per beat
+
+        Returns:
+            Working set dictionaries, one per beat, in beat order
+        """
+        if not beats:
+            return []
+
+        queries = [
+            f"{beat['description']}. Requirements: {', '.join(beat.get('requirements', []))}"
+            for beat in beats
+        ]
+
+        # Embed each distinct query text once, in a single batch
+        logger.info(f"[WORKING_SET] Batch-embedding queries for {len(beats)} beats")
+        embedding_map = self._embed_queries(queries)
+
+        # Every beat reads the same story shots; fetch once up front so
+        # worker threads only hit the warm cache and the batched search
+        # can confine its index walk to this story
+        story_shots = self._get_story_shots(story_slug, None)
+        story_shot_ids = [shot['shot_id'] for shot in story_shots]
+
+        # One batched index walk covers every distinct query; on any
+        # failure the per-beat calls fall back to their own search
+        results_map = {}
+        try:
+            if hasattr(self.vector_index, 'search_batch') and self.vector_index.size() > 0:
+                unique_queries = list(embedding_map)
+                query_matrix = np.stack(
+                    [np.asarray(embedding_map[q]) for q in unique_queries]
+                )
+                batch_results = self.vector_index.search_batch(
+                    query_matrix,
+                    k=min(max_shots + 10, self.vector_index.size()),
+                    allowed_ids=story_shot_ids
+                )
+                results_map = dict(zip(unique_queries, batch_results))
+        except Exception as e:
+            logger.warning(f"[WORKING_SET] Batched search failed ({e}), "
+                           f"falling back to per-beat search")
+            results_map = {}
+
+        def _build(beat: Dict, query: str) -> Dict:
+            working_set = self.build_for_query(
+                story_slug=story_slug,
+                query=query,
+                max_shots=max_shots,
+                include_neighbors=False,  # More focused for beats
+                query_embedding=embedding_map[query],
+                search_results=results_map.get(query)
+            )
+            working_set['beat_description'] = beat['description']
+            working_set['beat_requirements'] = beat.get('requirements', [])
+            return working_set
+
+        # With embeddings and searches precomputed, the remaining
+        # per-beat work (DB cache reads + scoring) is independent, so
+        # beats build concurrently on a thread pool
+        if len(beats) > 1:
+            max_workers = min(len(beats), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                working_sets = list(pool.map(_build, beats, queries))
+        else:
+            working_sets = [_build(beats[0], queries[0])]
+
+        return working_sets
+
+    def build_for_queries(self,
+                          story_slug: str,
+                          queries: List[str],
+                          max_shots: int = 50,
+                          shot_types: Optional[List[str]] = None,
+                          include_neighbors: bool = True) -> List[Dict]:
+        """
+        Build working sets for several queries with one embedding batch.
+
+        Args:
+            story_slug: Story identifier
+            queries: Text queries describing desired content
+            max_shots: Maximum number of shots per working set
+            shot_types: Optional filter for shot types
+            include_neighbors: Whether to include temporal neighbors
+
+        Returns:
+            Working set dictionaries, one per query, in query order
+        """
+        if not queries:
+            return []
+
+        embedding_map = self._embed_queries(queries)
+
+        # One index walk for all distinct queries, confined to the
+        # story's shots, mirroring build_for_beats; per-query builds
+        # fall back to their own search if the batch fails
+        story_shots = self._get_story_shots(story_slug, shot_types)
+        results_map = {}
+        try:
+            if hasattr(self.vector_index, 'search_batch') and self.vector_index.size() > 0:
+                unique_queries = list(embedding_map)
+                query_matrix = np.stack(
+                    [np.asarray(embedding_map[q]) for q in unique_queries]
+                )
+                batch_results = self.vector_index.search_batch(
+                    query_matrix,
+                    k=min(max_shots + 10, self.vector_index.size()),
+                    allowed_ids=[shot['shot_id'] for shot in story_shots]
+                )
+                results_map = dict(zip(unique_queries, batch_results))
+        except Exception as e:
+            logger.warning(f"[WORKING_SET] Batched search failed ({e}), "
+                           f"falling back to per-query search")
+            results_map = {}
+
+        return [
+            self.build_for_query(
+                story_slug=story_slug,
+                query=query,
+                max_shots=max_shots,
+                shot_types=shot_types,
+                include_neighbors=include_neighbors,
+                query_embedding=embedding_map[query],
+                search_results=results_map.get(query)
+            )
+            for query in queries
+        ]
+
+    def _embed_queries(self, queries: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Embed query texts, reusing cached vectors.
+
+        All cache misses go through embed_text in a single batch, so the
+        tokenizer and model forward pass are paid once regardless of how
+        many queries arrive together.
+
+        Args:
+            queries: Query strings (duplicates allowed)
+
+        Returns:
+            Mapping of query text to its embedding vector
+        """
+        unique_queries = list(dict.fromkeys(queries))
+
+        result = {}
+        with self._cache_lock:
+            missing = []
+            for query in unique_queries:
+                vector = self._query_embedding_cache.get(query)
+                if vector is None:
+                    missing.append(query)
+                else:
+                    self._query_embedding_cache.move_to_end(query)
+                    result[query] = vector
+
+        # Model forward pass runs outside the lock; a concurrent caller
+        # embedding the same text just overwrites with an equal vector
+        if missing:
+            embeddings = self.embedder.embed_text(missing)
+            with self._cache_lock:
+                for query, vector in zip(missing, embeddings):
+                    result[query] = vector
+                    self._query_embedding_cache[query] = vector
+                while len(self._query_embedding_cache) > self._query_embedding_cache_size:
+                    self._query_embedding_cache.popitem(last=False)
+
+        return result
+
+    def _apply_hybrid_scoring(self,
+                              shots: List[Dict],
+                              query: str,
+                              top_k: Optional[int] = None) -> List[Dict]:
         """
         Apply hybrid scoring combining semantic similarity with keyword matching and heuristics.
         
@@ -206,57 +538,91 @@ class WorkingSetBuilder:
         Returns:
             List of shots sorted by final combined score (descending)
         """
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        
-        for shot in shots:
-            # Get semantic score (0.0-1.0)
-            semantic_score = shot.get('semantic_score', 0.0)
-            
-            # Calculate keyword match score (0.0-1.0)
-            keyword_score = 0.0
-            asr_text = shot.get('asr_text', '').lower()
-            if asr_text:
-                asr_words = set(asr_text.split())
-                intersection = query_words & asr_words
-                union = query_words | asr_words
-                if union:
-                    keyword_score = len(intersection) / len(union)
-            
-            # Heuristic bonuses (smaller weights as tiebreakers)
-            heuristic_bonus = 0.0
-            
-            # Boost SOT shots
-            if shot.get('shot_type') == 'SOT':
-                heuristic_bonus += 0.15
-            
-            # Boost shots with faces
-            if shot.get('has_face'):
-                heuristic_bonus += 0.10
-            
-            # Prefer medium duration shots
-            duration_s = shot['duration_ms'] / 1000.0
-            if 3.0 <= duration_s <= 10.0:
-                heuristic_bonus += 0.05
-            
-            # Weighted combination: semantic (70%) + keyword (20%) + heuristics (10%)
-            final_score = (semantic_score * 0.7) + (keyword_score * 0.2) + (heuristic_bonus * 0.1)
-            
-            # Store component scores for transparency
-            shot['semantic_score'] = semantic_score
-            shot['keyword_score'] = keyword_score
-            shot['heuristic_bonus'] = heuristic_bonus
-            shot['final_score'] = final_score
-            shot['relevance_score'] = final_score  # Keep for compatibility
-        
-        # Sort by final score descending
-        shots.sort(key=lambda s: s['final_score'], reverse=True)
-        
-        logger.info(f"[WORKING_SET] Hybrid scoring complete. Top shot score: {shots[0]['final_score']:.3f}")
-        
+        arrays = ShotArrays.from_shots(shots)
+
+        # Component scores as whole-set vectors
+        semantic = np.fromiter((s.get('semantic_score', 0.0) for s in shots),
+                               dtype=np.float64, count=len(shots))
+        keyword = self._keyword_jaccard(shots, query)
+
+        # Heuristic bonuses (smaller weights as tiebreakers): SOT shots,
+        # shots with faces, medium-duration shots
+        duration_s = arrays.duration_seconds()
+        heuristic = (arrays.is_sot * 0.15
+                     + arrays.has_face * 0.10
+                     + ((duration_s >= 3.0) & (duration_s <= 10.0)) * 0.05)
+
+        # Weighted combination: semantic (70%) + keyword (20%) + heuristics (10%)
+        final = semantic * 0.7 + keyword * 0.2 + heuristic * 0.1
+
+        # Store component scores for transparency
+        for i, shot in enumerate(shots):
+            shot['semantic_score'] = float(semantic[i])
+            shot['keyword_score'] = float(keyword[i])
+            shot['heuristic_bonus'] = float(heuristic[i])
+            shot['final_score'] = float(final[i])
+            shot['relevance_score'] = float(final[i])  # Keep for compatibility
+
+        # Partial selection: only the requested top block is sorted,
+        # with ties resolved as a stable descending sort would
+        order = _top_k_desc(final, top_k)
+        shots = [shots[i] for i in order]
+
+        logger.debug(f"[WORKING_SET] Hybrid scoring complete. Top shot score: {shots[0]['final_score']:.3f}")
+
         return shots
+
+    @staticmethod
+    def _keyword_jaccard(shots: List[Dict], query: str) -> np.ndarray:
+        """
+        Jaccard similarity between the query and every shot transcript.
+
+        Computed over a binary sparse term-presence matrix built once
+        for all transcripts instead of per-shot Python sets. Fitting
+        the query alongside the transcripts makes the vocabulary the
+        union of all words, so the sparse counts match exact set
+        arithmetic.
+
+        Args:
+            shots: Shot dictionaries (asr_text is read)
+            query: Query string
+
+        Returns:
+            float64 array of Jaccard scores in [0, 1], one per shot
+        """
+        n = len(shots)
+
+        # Transcript tokens are memoized per shot dict (the _asr_tokens
+        # key survives working-set copies), so repeat queries skip the
+        # lower/split pass entirely
+        documents = []
+        for shot in shots:
+            tokens = shot.get('_asr_tokens')
+            if tokens is None:
+                tokens = tuple(shot.get('asr_text', '').lower().split())
+                shot['_asr_tokens'] = tokens
+            documents.append(tokens)
+
+        try:
+            vectorizer = CountVectorizer(binary=True, analyzer=lambda doc: doc)
+            matrix = vectorizer.fit_transform(documents + [query.lower().split()])
+            presence = matrix[:-1]
+            query_vec = matrix[-1]
+
+            intersection = (presence @ query_vec.T).toarray().ravel()
+            union = (np.asarray(presence.sum(axis=1)).ravel()
+                     + query_vec.sum() - intersection)
+            return np.divide(intersection, union,
+                             out=np.zeros(n, dtype=np.float64),
+                             where=union > 0)
+        except ValueError:
+            # Empty vocabulary: no words in query or transcripts
+            return np.zeros(n, dtype=np.float64)
     
-    def _score_shots(self, shots: List[Dict], query: str) -> List[Dict]:
+    def _score_shots(self,
+                     shots: List[Dict],
+                     query: str,
+                     top_k: Optional[int] = None) -> List[Dict]:
         """
         Score shots based on keyword matching and heuristics (fallback when semantic search unavailable).
         
@@ -267,98 +633,171 @@ class WorkingSetBuilder:
         Returns:
             List of shots sorted by relevance score (descending)
         """
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        
-        scored = []
-        for shot in shots:
-            score = 0.0
-            
-            # Score based on transcript match
-            asr_text = shot.get('asr_text', '').lower()
-            if asr_text:
-                asr_words = set(asr_text.split())
-                # Jaccard similarity
-                intersection = query_words & asr_words
-                union = query_words | asr_words
-                if union:
-                    score += len(intersection) / len(union) * 10.0
-            
-            # Boost SOT shots (usually more important)
-            if shot.get('shot_type') == 'SOT':
-                score += 2.0
-            
-            # Boost shots with faces
-            if shot.get('has_face'):
-                score += 1.0
-            
-            # Prefer medium duration shots (not too short, not too long)
-            duration_s = shot['duration_ms'] / 1000.0
-            if 3.0 <= duration_s <= 10.0:
-                score += 1.0
-            
-            shot['relevance_score'] = score
-            scored.append(shot)
-        
-        # Sort by score descending
-        scored.sort(key=lambda s: s['relevance_score'], reverse=True)
-        
-        return scored
+        if not shots:
+            return []
+
+        arrays = ShotArrays.from_shots(shots)
+        jaccard = self._keyword_jaccard(shots, query)
+
+        # Heuristic boosts as boolean vectors
+        duration_s = arrays.duration_seconds()
+        medium_duration = (duration_s >= 3.0) & (duration_s <= 10.0)
+
+        scores = (jaccard * 10.0
+                  + arrays.is_sot * 2.0
+                  + arrays.has_face
+                  + medium_duration)
+
+        for shot, score in zip(shots, scores):
+            shot['relevance_score'] = float(score)
+
+        # Partial selection: only the requested top block is sorted,
+        # with ties resolved as a stable descending sort would
+        order = _top_k_desc(scores, top_k)
+        return [shots[i] for i in order]
     
+    def _invalidate_story_caches(self, story_slug: str):
+        """Drop cached shots and capture orders for a changed story."""
+        with self._cache_lock:
+            for cache in (self._capture_order_cache, self._story_shots_cache):
+                stale = [key for key in cache if key[0] == story_slug]
+                for key in stale:
+                    del cache[key]
+
+    def _get_story_shots(self,
+                         story_slug: str,
+                         shot_types: Optional[List[str]]) -> List[Dict]:
+        """
+        Fetch a story's shots, reusing a recent result when available.
+
+        Repeated beat builds issue the same get_shots_by_story query; a
+        cache hit returns fresh shallow copies of the snapshot (matching
+        the database contract of new dicts per call) without the SQL
+        round trip and row materialization.
+
+        Args:
+            story_slug: Story identifier
+            shot_types: Optional shot-type filter
+
+        Returns:
+            List of shot dictionaries
+        """
+        key = (story_slug, tuple(shot_types) if shot_types else None)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            entry = self._story_shots_cache.get(key)
+            if entry is not None and now - entry[0] < self._story_shots_ttl:
+                self._story_shots_cache.move_to_end(key)
+                return [dict(shot) for shot in entry[1]]
+
+        # SQL round trip runs outside the lock; concurrent misses on the
+        # same story just race to store equivalent snapshots
+        shots = self.database.get_shots_by_story(story_slug, shot_types=shot_types)
+
+        # Tokenize transcripts once per fetch; the memo rides along into
+        # the snapshot so every later copy skips re-splitting
+        for shot in shots:
+            if '_asr_tokens' not in shot:
+                shot['_asr_tokens'] = tuple(shot.get('asr_text', '').lower().split())
+
+        # Snapshot before the caller annotates the dicts with scores
+        with self._cache_lock:
+            self._story_shots_cache[key] = (now, [dict(shot) for shot in shots])
+            while len(self._story_shots_cache) > self._story_shots_cache_size:
+                self._story_shots_cache.popitem(last=False)
+
+        return shots
+
+    def _capture_order(self,
+                       story_slug: str,
+                       shot_types: Optional[List[str]],
+                       all_shots: List[Dict]) -> Tuple[Tuple[int, ...], Dict[int, int]]:
+        """
+        Shot IDs of a story sorted by capture time plus the reverse
+        shot_id -> position mapping, cached per (story, shot-type
+        filter) so repeated beat calls skip the O(N log N) sort and
+        the O(N) position dict rebuild.
+
+        Args:
+            story_slug: Story identifier
+            shot_types: Shot-type filter used to fetch all_shots
+            all_shots: The story's shots as currently loaded
+
+        Returns:
+            (order, positions): tuple of shot IDs in capture order and
+            a dict mapping shot_id to its index in that order
+        """
+        key = (story_slug, tuple(shot_types) if shot_types else None)
+
+        with self._cache_lock:
+            entry = self._capture_order_cache.get(key)
+            if entry is not None and len(entry[0]) == len(all_shots):
+                self._capture_order_cache.move_to_end(key)
+                return entry
+
+        order = tuple(
+            shot['shot_id']
+            for shot in sorted(all_shots, key=lambda s: s['capture_ts'])
+        )
+        entry = (order, {shot_id: i for i, shot_id in enumerate(order)})
+
+        with self._cache_lock:
+            self._capture_order_cache[key] = entry
+            while len(self._capture_order_cache) > self._capture_order_cache_size:
+                self._capture_order_cache.popitem(last=False)
+
+        return entry
+
     def _add_temporal_neighbors(self,
                                selected_shots: List[Dict],
                                all_shots: List[Dict],
-                               max_total: int) -> List[Dict]:
+                               max_total: int,
+                               capture_order: Optional[Tuple[int, ...]] = None,
+                               capture_positions: Optional[Dict[int, int]] = None) -> List[Dict]:
         """
         Add temporal neighbors (shots before/after) to provide context.
-        
+
         Args:
             selected_shots: Currently selected shots
             all_shots: All available shots
             max_total: Maximum total shots to return
-            
+            capture_order: Precomputed shot IDs in capture order (skips
+                           the per-call sort)
+            capture_positions: Precomputed shot_id -> capture-order
+                               position map (skips the per-call rebuild)
+
         Returns:
             Extended list of shots including neighbors
         """
         if len(selected_shots) >= max_total:
             return selected_shots
-        
-        # Create lookup by shot_id
-        shot_lookup = {s['shot_id']: s for s in all_shots}
-        selected_ids = {s['shot_id'] for s in selected_shots}
-        
-        # Sort all shots by time
-        sorted_shots = sorted(all_shots, key=lambda s: s['capture_ts'])
-        shot_positions = {s['shot_id']: i for i, s in enumerate(sorted_shots)}
-        
-        # Add neighbors
-        neighbors_to_add = []
-        budget = max_total - len(selected_shots)
-        
-        for shot in selected_shots:
-            if budget <= 0:
-                break
-            
-            pos = shot_positions[shot['shot_id']]
-            
-            # Add previous shot
-            if pos > 0:
-                prev_shot = sorted_shots[pos - 1]
-                if prev_shot['shot_id'] not in selected_ids:
-                    neighbors_to_add.append(prev_shot)
-                    selected_ids.add(prev_shot['shot_id'])
-                    budget -= 1
-            
-            # Add next shot
-            if budget > 0 and pos < len(sorted_shots) - 1:
-                next_shot = sorted_shots[pos + 1]
-                if next_shot['shot_id'] not in selected_ids:
-                    neighbors_to_add.append(next_shot)
-                    selected_ids.add(next_shot['shot_id'])
-                    budget -= 1
-        
-        logger.info(f"[WORKING_SET] Added {len(neighbors_to_add)} temporal neighbors")
-        
+
+        # Arrange all shots by time, reusing the cached order when given
+        if capture_order is None:
+            sorted_shots = sorted(all_shots, key=lambda s: s['capture_ts'])
+        else:
+            shot_lookup = {s['shot_id']: s for s in all_shots}
+            sorted_shots = [shot_lookup[shot_id] for shot_id in capture_order]
+        if capture_positions is None:
+            capture_positions = {s['shot_id']: i for i, s in enumerate(sorted_shots)}
+
+        # Expansion runs as an array kernel over capture-order positions
+        # with a bitset for membership (numba-compiled when available)
+        selected_pos = np.fromiter(
+            (capture_positions[s['shot_id']] for s in selected_shots),
+            dtype=np.int64,
+            count=len(selected_shots)
+        )
+        neighbor_pos = expand_temporal_neighbors(
+            selected_pos,
+            len(sorted_shots),
+            max_total - len(selected_shots)
+        )
+        neighbors_to_add = [sorted_shots[pos] for pos in neighbor_pos]
+
+        logger.debug(f"[WORKING_SET] Added {len(neighbors_to_add)} temporal neighbors")
+
         return selected_shots + neighbors_to_add
     
     def format_for_llm(self, working_set: Dict, include_transcripts: bool = True) -> str:
@@ -372,35 +811,40 @@ class WorkingSetBuilder:
         Returns:
             Formatted string for LLM context
         """
-        lines = []
-        lines.append(f"# Working Set: {working_set['story_slug']}")
-        lines.append(f"Query: {working_set.get('query', 'N/A')}")
-        lines.append(f"Total Shots: {len(working_set['shots'])}")
-        lines.append(f"Total Duration: {working_set['total_duration']:.1f}s")
-        lines.append(f"Shot Types: {working_set['shot_type_counts']}")
-        lines.append("")
-        lines.append("## Available Shots")
-        lines.append("")
-        
+        # Stream blocks into the join instead of accumulating a line
+        # list, so peak memory stays near the output size even for
+        # transcript-heavy working sets
+        return "\n".join(self._iter_llm_blocks(working_set, include_transcripts))
+
+    @staticmethod
+    def _iter_llm_blocks(working_set: Dict, include_transcripts: bool):
+        """Yield the formatted text blocks that make up format_for_llm."""
+        yield (
+            f"# Working Set: {working_set['story_slug']}\n"
+            f"Query: {working_set.get('query', 'N/A')}\n"
+            f"Total Shots: {len(working_set['shots'])}\n"
+            f"Total Duration: {working_set['total_duration']:.1f}s\n"
+            f"Shot Types: {working_set['shot_type_counts']}\n"
+            "\n"
+            "## Available Shots\n"
+        )
+
         for i, shot in enumerate(working_set['shots'], 1):
-            lines.append(f"### Shot {i}: {shot['shot_id']}")
-            lines.append(f"- Type: {shot.get('shot_type', 'UNKNOWN')}")
-            lines.append(f"- Duration: {shot['duration_ms'] / 1000.0:.1f}s")
-            lines.append(f"- Timecode: {shot['tc_in']} - {shot['tc_out']}")
-            lines.append(f"- Has Face: {shot.get('has_face', False)}")
-            
-            if shot.get('relevance_score'):
-                lines.append(f"- Relevance Score: {shot['relevance_score']:.2f}")
-            
-            if include_transcripts and shot.get('asr_text'):
-                lines.append(f"- Transcript: \"{shot['asr_text']}\"")
-            
-            if shot.get('asr_summary'):
-                lines.append(f"- Summary: {shot['asr_summary']}")
-            
-            lines.append("")
-        
-        return "\n".join(lines)
+            g = shot.get
+            block = (
+                f"### Shot {i}: {shot['shot_id']}\n"
+                f"- Type: {g('shot_type', 'UNKNOWN')}\n"
+                f"- Duration: {shot['duration_ms'] / 1000.0:.1f}s\n"
+                f"- Timecode: {shot['tc_in']} - {shot['tc_out']}\n"
+                f"- Has Face: {g('has_face', False)}"
+            )
+            if g('relevance_score'):
+                block += f"\n- Relevance Score: {shot['relevance_score']:.2f}"
+            if include_transcripts and (asr := g('asr_text')):
+                block += f"\n- Transcript: \"{asr}\""
+            if g('asr_summary'):
+                block += f"\n- Summary: {shot['asr_summary']}"
+            yield block + "\n"
     
     def get_shot_details(self, shot_id: int) -> Optional[Dict]:
         """
@@ -0,0 +1,114 @@
+"""
+Query result cache for the API layer.
+
+Caches working-set responses keyed by the normalized request, so
+repeated identical searches skip the embedding and vector-search work
+entirely. Entries expire after a TTL and are evicted LRU; ingestion
+invalidates a story's entries explicitly.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class QueryCache:
+    """Thread-safe LRU cache with per-entry TTL and story invalidation."""
+
+    def __init__(self, max_entries: int = 2000, ttl_seconds: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses before LRU eviction
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        # key -> (expiry, story_slug, value)
+        self._entries: 'OrderedDict[bytes, tuple]' = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(**request_fields: Any) -> bytes:
+        """Hash the normalized request fields into a cache key."""
+        payload = json.dumps(request_fields, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Return the cached value for key, or None on miss/expiry.
+
+        Args:
+            key: Cache key from make_key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expiry, _, value = entry
+            if time.monotonic() >= expiry:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: bytes, story_slug: str, value: Any) -> None:
+        """
+        Store a response, evicting the least recently used on overflow.
+
+        Args:
+            key: Cache key from make_key
+            story_slug: Story the response belongs to (for invalidation)
+            value: Response payload to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds,
+                                  story_slug, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, story_slug: Optional[str] = None) -> int:
+        """
+        Drop entries for a story, or everything when no story is given.
+
+        Args:
+            story_slug: Story whose entries should be dropped
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if story_slug is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            stale = [key for key, (_, slug, _) in self._entries.items()
+                     if slug == story_slug]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+            }
@@ -13,7 +13,7 @@ os.environ['OPENBLAS_NUM_THREADS'] = '1'
 
 from fastapi import FastAPI, HTTPException, Query, UploadFile, File, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import logging
@@ -21,10 +21,12 @@ import yaml
 from pathlib import Path
 import asyncio
 import json
-import shutil
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import uuid
 
+from api.query_cache import QueryCache
 from storage.database import ShotsDatabase
 from storage.vector_index import VectorIndex
 from agent.working_set import WorkingSetBuilder
@@ -45,7 +47,10 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="News Edit Agent API",
     description="REST API for AI-powered news video editing",
-    version="0.1.0"
+    version="0.1.0",
+    # orjson serializes the large working-set/result payloads several
+    # times faster than the stdlib json default
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -66,12 +71,28 @@ agent_orchestrator: Optional[AgentOrchestrator] = None
 llm_client: Optional[ClaudeClient] = None
 config: Optional[Dict] = None
 
+# Cache working-set responses across clients; ingestion invalidates
+query_cache = QueryCache()
+
+# EDL timecodes: HH:MM:SS:FF with either ':' or ';' separators
+TC_RE = re.compile(r'(\d+)[:;](\d+)[:;](\d+)[:;](\d+)')
+
+# Story stats change only when ingestion finishes, so responses are
+# cached per story and dropped when a story's ingestion job completes
+story_stats_cache: Dict[str, "StoryStatsResponse"] = {}
+
 # Track ingestion jobs
 ingestion_jobs: Dict[str, Dict[str, Any]] = {}
 
 # Track compilation jobs
 compilation_jobs: Dict[str, Dict[str, Any]] = {}
 
+# Per-connection queues feeding the compilation progress WebSocket,
+# grouped by job. Each client registers its own queue on connect and
+# removes it on disconnect; the whole group is dropped once the job
+# reaches a terminal state, so nothing accumulates for unwatched jobs.
+compilation_listeners: Dict[str, List[asyncio.Queue]] = {}
+
 
 # Pydantic models for request/response
 class SearchRequest(BaseModel):
@@ -83,6 +104,15 @@ class SearchRequest(BaseModel):
     include_neighbors: bool = Field(True, description="Include temporal neighbors")
 
 
+class BatchSearchRequest(BaseModel):
+    """Request model for batched shot search."""
+    story_slug: str = Field(..., description="Story identifier")
+    queries: List[str] = Field(..., description="Search queries to run together")
+    max_shots: int = Field(50, description="Maximum number of shots per query")
+    shot_types: Optional[List[str]] = Field(None, description="Filter by shot types")
+    include_neighbors: bool = Field(True, description="Include temporal neighbors")
+
+
 class WorkingSetRequest(BaseModel):
     """Request model for building working set."""
     story_slug: str = Field(..., description="Story identifier")
@@ -197,6 +227,7 @@ async def root():
         "status": "running",
         "endpoints": {
             "search": "/api/shots/search",
+            "batch_search": "/api/shots/search/batch",
             "shot_details": "/api/shots/{shot_id}",
             "story_stats": "/api/stories/{story_slug}/stats",
             "working_set": "/api/working-set/build",
@@ -212,7 +243,8 @@ async def health_check():
         "status": "healthy",
         "database": database is not None,
         "vector_index": vector_index is not None,
-        "working_set_builder": working_set_builder is not None
+        "working_set_builder": working_set_builder is not None,
+        "query_cache": query_cache.get_stats()
     }
 
 
@@ -226,33 +258,80 @@ async def search_shots(request: SearchRequest):
     if not working_set_builder:
         raise HTTPException(status_code=500, detail="Working set builder not initialized")
     
+    cache_key = QueryCache.make_key(
+        endpoint="search",
+        story_slug=request.story_slug,
+        query=request.query,
+        max_shots=request.max_shots,
+        shot_types=request.shot_types,
+        include_neighbors=request.include_neighbors
+    )
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        working_set = working_set_builder.build_for_query(
+        # Build off the event loop so concurrent requests aren't blocked
+        working_set = await asyncio.to_thread(
+            working_set_builder.build_for_query,
             story_slug=request.story_slug,
             query=request.query,
             max_shots=request.max_shots,
             shot_types=request.shot_types,
             include_neighbors=request.include_neighbors
         )
-        
-        return {
+
+        response = {
             "success": True,
             "working_set": working_set
         }
-        
+        query_cache.put(cache_key, request.story_slug, response)
+        return response
+
     except Exception as e:
         logger.error(f"[API] Search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/shots/search/batch")
+async def search_shots_batch(request: BatchSearchRequest):
+    """
+    Search for shots with several queries in one request.
+
+    All queries share one embedding batch and one vector-index walk,
+    which is much cheaper than issuing them as separate searches.
+    """
+    if not working_set_builder:
+        raise HTTPException(status_code=500, detail="Working set builder not initialized")
+
+    try:
+        working_sets = await asyncio.to_thread(
+            working_set_builder.build_for_queries,
+            story_slug=request.story_slug,
+            queries=request.queries,
+            max_shots=request.max_shots,
+            shot_types=request.shot_types,
+            include_neighbors=request.include_neighbors
+        )
+
+        return {
+            "success": True,
+            "working_sets": working_sets
+        }
+
+    except Exception as e:
+        logger.error(f"[API] Batch search failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/shots/{shot_id}")
 async def get_shot(shot_id: int):
     """Get detailed information about a specific shot."""
     if not database:
         raise HTTPException(status_code=500, detail="Database not initialized")
     
-    shot = database.get_shot(shot_id)
-    
+    shot = await asyncio.to_thread(database.get_shot, shot_id)
+
     if not shot:
         raise HTTPException(status_code=404, detail=f"Shot {shot_id} not found")
     
@@ -271,7 +350,7 @@ async def get_shot_neighbors(
     if not database:
         raise HTTPException(status_code=500, detail="Database not initialized")
     
-    neighbors = database.get_neighbors(shot_id, edge_types)
+    neighbors = await asyncio.to_thread(database.get_neighbors, shot_id, edge_types)
     
     return {
         "success": True,
@@ -285,32 +364,24 @@ async def get_story_stats(story_slug: str):
     """Get statistics for a story."""
     if not database:
         raise HTTPException(status_code=500, detail="Database not initialized")
-    
-    shots = database.get_shots_by_story(story_slug)
-    
-    if not shots:
-        return StoryStatsResponse(
-            story_slug=story_slug,
-            total_shots=0,
-            total_duration_s=0.0,
-            shot_type_counts={},
-            has_data=False
-        )
-    
-    # Calculate statistics
-    total_duration = sum(shot['duration_ms'] for shot in shots) / 1000.0
-    shot_type_counts = {}
-    for shot in shots:
-        shot_type = shot.get('shot_type', 'UNKNOWN')
-        shot_type_counts[shot_type] = shot_type_counts.get(shot_type, 0) + 1
-    
-    return StoryStatsResponse(
+
+    cached = story_stats_cache.get(story_slug)
+    if cached is not None:
+        return cached
+
+    # Aggregation runs as one GROUP BY in SQLite instead of scanning
+    # every shot row in Python
+    stats = await asyncio.to_thread(database.get_story_stats, story_slug)
+
+    response = StoryStatsResponse(
         story_slug=story_slug,
-        total_shots=len(shots),
-        total_duration_s=total_duration,
-        shot_type_counts=shot_type_counts,
-        has_data=True
+        total_shots=stats['total_shots'],
+        total_duration_s=stats['total_duration_s'],
+        shot_type_counts=stats['shot_type_counts'],
+        has_data=stats['total_shots'] > 0
     )
+    story_stats_cache[story_slug] = response
+    return response
 
 
 @app.post("/api/working-set/build")
@@ -319,27 +390,49 @@ async def build_working_set(request: WorkingSetRequest):
     if not working_set_builder:
         raise HTTPException(status_code=500, detail="Working set builder not initialized")
     
+    # One entry serves both plain and LLM-formatted requests: the
+    # formatted string is attached lazily on the first request that
+    # asks for it, so toggling the flag never rebuilds the working set
+    cache_key = QueryCache.make_key(
+        endpoint="working_set",
+        story_slug=request.story_slug,
+        query=request.query,
+        max_shots=request.max_shots,
+        shot_types=request.shot_types
+    )
+    cached = query_cache.get(cache_key)
+
     try:
-        working_set = working_set_builder.build_for_query(
-            story_slug=request.story_slug,
-            query=request.query,
-            max_shots=request.max_shots,
-            shot_types=request.shot_types,
-            include_neighbors=True
-        )
-        
+        if cached is not None:
+            working_set = cached["working_set"]
+        else:
+            working_set = await asyncio.to_thread(
+                working_set_builder.build_for_query,
+                story_slug=request.story_slug,
+                query=request.query,
+                max_shots=request.max_shots,
+                shot_types=request.shot_types,
+                include_neighbors=True
+            )
+            cached = {"working_set": working_set, "llm_context": None}
+            query_cache.put(cache_key, request.story_slug, cached)
+
         response = {
             "success": True,
             "working_set": working_set
         }
-        
+
         # Optionally format for LLM
         if request.format_for_llm:
-            formatted = working_set_builder.format_for_llm(working_set)
-            response["llm_context"] = formatted
-        
+            if cached["llm_context"] is None:
+                cached["llm_context"] = await asyncio.to_thread(
+                    working_set_builder.format_for_llm, working_set
+                )
+                query_cache.put(cache_key, request.story_slug, cached)
+            response["llm_context"] = cached["llm_context"]
+
         return response
-        
+
     except Exception as e:
         logger.error(f"[API] Working set build failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -352,7 +445,8 @@ async def build_beat_working_set(request: BeatWorkingSetRequest):
         raise HTTPException(status_code=500, detail="Working set builder not initialized")
     
     try:
-        working_set = working_set_builder.build_for_beat(
+        working_set = await asyncio.to_thread(
+            working_set_builder.build_for_beat,
             story_slug=request.story_slug,
             beat_description=request.beat_description,
             beat_requirements=request.beat_requirements,
@@ -398,11 +492,12 @@ class GenerateEditRequest(BaseModel):
     max_iterations: int = Field(3, description="Maximum iterations for refinement")
 
 
-def run_compilation_task(job_id: str, story_slug: str, brief: str, target_duration: int, 
-                        max_iterations: int, min_verification_score: float):
+def run_compilation_task(job_id: str, story_slug: str, brief: str, target_duration: int,
+                        max_iterations: int, min_verification_score: float,
+                        loop: Optional[asyncio.AbstractEventLoop] = None):
     """
     Background task to run edit compilation using AI agents.
-    
+
     Args:
         job_id: Unique job identifier
         story_slug: Story identifier
@@ -410,9 +505,26 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
         target_duration: Target duration in seconds
         max_iterations: Maximum refinement iterations
         min_verification_score: Minimum acceptable verification score
+        loop: Event loop to deliver WebSocket progress updates on
     """
     global compilation_jobs, agent_orchestrator, database
-    
+
+    def push_update(update: Dict[str, Any]):
+        """Fan a progress update out to the job's WebSocket listeners;
+        this task runs in a worker thread, so the queues must be fed
+        on the event loop. Terminal updates drop the listener group
+        afterwards — late clients replay state from compilation_jobs."""
+        if loop is None:
+            return
+
+        def _broadcast():
+            for listener in compilation_listeners.get(job_id, []):
+                listener.put_nowait(update)
+            if update.get("type") in ("complete", "failed"):
+                compilation_listeners.pop(job_id, None)
+
+        loop.call_soon_threadsafe(_broadcast)
+
     try:
         compilation_jobs[job_id] = {
             "status": "processing",
@@ -426,6 +538,7 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
             "start_time": datetime.now().isoformat(),
             "plan": None,
             "beats_progress": [],
+            "completed_beats": 0,
             "current_beat": None,
             "result": None,
             "error": None
@@ -438,11 +551,13 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
             raise Exception("Agent orchestrator not initialized")
         
         # Update status: planning
-        compilation_jobs[job_id]["status"] = "planning"
-        compilation_jobs[job_id]["current_stage"] = "planning"
-        compilation_jobs[job_id]["current_agent"] = "Planner"
-        compilation_jobs[job_id]["message"] = "Creating narrative plan..."
-        compilation_jobs[job_id]["progress"] = 10
+        compilation_jobs[job_id].update({
+            "status": "planning",
+            "current_stage": "planning",
+            "current_agent": "Planner",
+            "message": "Creating narrative plan...",
+            "progress": 10
+        })
         
         # Define callback to update status during compilation
         def status_callback(stage: str, data: Dict[str, Any]):
@@ -451,11 +566,7 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
                 if stage == "plan_created":
                     # Store the plan and update beats
                     plan = data.get("plan", {})
-                    compilation_jobs[job_id]["plan"] = plan
-                    compilation_jobs[job_id]["current_stage"] = "planning_complete"
-                    compilation_jobs[job_id]["message"] = f"Plan created: {len(plan.get('beats', []))} beats"
-                    compilation_jobs[job_id]["progress"] = 20
-                    
+
                     # Initialize beat progress tracking
                     beats_progress = []
                     for i, beat in enumerate(plan.get('beats', [])):
@@ -467,20 +578,30 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
                             "status": "pending",
                             "shots": []
                         })
-                    compilation_jobs[job_id]["beats_progress"] = beats_progress
-                
+
+                    compilation_jobs[job_id].update({
+                        "plan": plan,
+                        "current_stage": "planning_complete",
+                        "message": f"Plan created: {len(plan.get('beats', []))} beats",
+                        "progress": 20,
+                        "beats_progress": beats_progress,
+                        "completed_beats": 0
+                    })
+
                 elif stage == "beat_searching":
                     # Update current beat being worked on
                     beat_index = data.get("beat_index", 0)
                     beat_title = data.get("beat_title", "")
-                    compilation_jobs[job_id]["current_stage"] = "shot_selection"
-                    compilation_jobs[job_id]["current_agent"] = "Picker"
-                    compilation_jobs[job_id]["current_beat"] = {
-                        "index": beat_index,
-                        "title": beat_title
-                    }
-                    compilation_jobs[job_id]["message"] = f"Searching shots for: {beat_title}"
-                    
+                    compilation_jobs[job_id].update({
+                        "current_stage": "shot_selection",
+                        "current_agent": "Picker",
+                        "current_beat": {
+                            "index": beat_index,
+                            "title": beat_title
+                        },
+                        "message": f"Searching shots for: {beat_title}"
+                    })
+
                     # Update beat status
                     if beat_index < len(compilation_jobs[job_id]["beats_progress"]):
                         compilation_jobs[job_id]["beats_progress"][beat_index]["status"] = "searching"
@@ -489,29 +610,51 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
                     # Mark beat as complete with selected shots
                     beat_index = data.get("beat_index", 0)
                     shots = data.get("shots", [])
-                    
+
                     if beat_index < len(compilation_jobs[job_id]["beats_progress"]):
-                        compilation_jobs[job_id]["beats_progress"][beat_index]["status"] = "complete"
-                        compilation_jobs[job_id]["beats_progress"][beat_index]["shots"] = shots
-                    
-                    # Update progress
+                        beat_progress = compilation_jobs[job_id]["beats_progress"][beat_index]
+                        if beat_progress["status"] != "complete":
+                            compilation_jobs[job_id]["completed_beats"] += 1
+                        beat_progress.update({
+                            "status": "complete",
+                            "shots": shots
+                        })
+
+                    # Update progress from the running counter rather
+                    # than rescanning every beat on each completion
                     total_beats = len(compilation_jobs[job_id]["beats_progress"])
-                    completed_beats = sum(1 for b in compilation_jobs[job_id]["beats_progress"] if b["status"] == "complete")
+                    completed_beats = compilation_jobs[job_id]["completed_beats"]
                     compilation_jobs[job_id]["progress"] = 20 + int((completed_beats / total_beats) * 50)
-                
+
                 elif stage == "verification":
-                    compilation_jobs[job_id]["current_stage"] = "verification"
-                    compilation_jobs[job_id]["current_agent"] = "Verifier"
-                    compilation_jobs[job_id]["message"] = "Verifying edit quality..."
-                    compilation_jobs[job_id]["progress"] = 75
-                
+                    compilation_jobs[job_id].update({
+                        "current_stage": "verification",
+                        "current_agent": "Verifier",
+                        "message": "Verifying edit quality...",
+                        "progress": 75
+                    })
+
                 elif stage == "iteration_complete":
                     iteration = data.get("iteration", 0)
                     score = data.get("score", 0)
-                    compilation_jobs[job_id]["current_iteration"] = iteration
-                    compilation_jobs[job_id]["message"] = f"Iteration {iteration} complete (score: {score:.1f})"
-                    compilation_jobs[job_id]["progress"] = 80
-                
+                    compilation_jobs[job_id].update({
+                        "current_iteration": iteration,
+                        "message": f"Iteration {iteration} complete (score: {score:.1f})",
+                        "progress": 80
+                    })
+
+                job = compilation_jobs[job_id]
+                push_update({
+                    "type": "progress",
+                    "stage": stage,
+                    "progress": job["progress"],
+                    "message": job["message"],
+                    "current_stage": job.get("current_stage"),
+                    "current_agent": job.get("current_agent"),
+                    "current_beat": job.get("current_beat"),
+                    "timestamp": datetime.now().isoformat()
+                })
+
             except Exception as e:
                 logger.error(f"[COMPILATION] Status callback error: {e}")
         
@@ -542,7 +685,8 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
                     'beats': []
                 }
                 
-                for beat_selection in result['final_selections'].get('beat_selections', []):
+                beat_selections = result['final_selections'].get('beat_selections', [])
+                for beat_selection in beat_selections:
                     beat_data = {
                         'beat_name': beat_selection['beat'].get('title', 'UNTITLED'),
                         'shots': []
@@ -554,10 +698,10 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
                         
                         # Parse trim_in timecode to get start time in seconds
                         trim_in = shot.get('trim_in', '00:00:00:00')
-                        parts = trim_in.replace(';', ':').split(':')
-                        if len(parts) == 4:
-                            h, m, s, f = map(int, parts)
-                            start_time = h * 3600 + m * 60 + s + f / 25.0
+                        m = TC_RE.match(trim_in)
+                        if m:
+                            h, mn, s, f = map(int, m.groups())
+                            start_time = h * 3600 + mn * 60 + s + f / 25.0
                         else:
                             start_time = 0.0
                         
@@ -585,23 +729,59 @@ def run_compilation_task(job_id: str, story_slug: str, brief: str, target_durati
                 logger.error(traceback.format_exc())
         
         # Mark as complete
-        compilation_jobs[job_id]["status"] = "complete"
-        compilation_jobs[job_id]["progress"] = 100
-        compilation_jobs[job_id]["message"] = "Edit compilation complete!"
-        compilation_jobs[job_id]["result"] = result
-        compilation_jobs[job_id]["end_time"] = datetime.now().isoformat()
+        compilation_jobs[job_id].update({
+            "status": "complete",
+            "progress": 100,
+            "message": "Edit compilation complete!",
+            "result": result,
+            "end_time": datetime.now().isoformat()
+        })
         
+        push_update({
+            "type": "complete",
+            "progress": 100,
+            "message": compilation_jobs[job_id]["message"],
+            "approved": result.get("approved", False),
+            "timestamp": datetime.now().isoformat()
+        })
+
         logger.info(f"[COMPILATION] ✓ Job {job_id} completed")
         logger.info(f"[COMPILATION] Approved: {result.get('approved')}")
         logger.info(f"[COMPILATION] Iterations: {len(result.get('iterations', []))}")
-        
+
     except Exception as e:
         logger.error(f"[COMPILATION] ✗ Job {job_id} failed: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        compilation_jobs[job_id]["status"] = "failed"
-        compilation_jobs[job_id]["error"] = str(e)
-        compilation_jobs[job_id]["end_time"] = datetime.now().isoformat()
+        compilation_jobs[job_id].update({
+            "status": "failed",
+            "error": str(e),
+            "end_time": datetime.now().isoformat()
+        })
+        push_update({
+            "type": "failed",
+            "message": str(e),
+            "timestamp": datetime.now().isoformat()
+        })
+
+
+# Worker-process orchestrator for parallel ingestion; built once per
+# process by the pool initializer so model state isn't re-created per video
+_worker_ingest_orchestrator: Optional[IngestOrchestrator] = None
+
+
+def _init_ingest_worker(worker_config: Dict):
+    """Construct the per-process orchestrator for the ingestion pool."""
+    global _worker_ingest_orchestrator
+    _worker_ingest_orchestrator = IngestOrchestrator(worker_config)
+
+
+def _ingest_video_in_worker(story_slug: str, video_path: str) -> Dict[str, Any]:
+    """Ingest one video inside a pool worker process."""
+    return _worker_ingest_orchestrator.ingest_video(
+        video_path=video_path,
+        story_id=story_slug
+    )
 
 
 def run_ingestion_task(job_id: str, story_slug: str, video_paths: List[str]):
@@ -632,38 +812,67 @@ def run_ingestion_task(job_id: str, story_slug: str, video_paths: List[str]):
         if not ingest_orchestrator:
             raise Exception("Ingest orchestrator not initialized")
         
-        # Process each video
-        for i, video_path in enumerate(video_paths):
-            try:
-                logger.info(f"[INGESTION] Processing {i+1}/{len(video_paths)}: {Path(video_path).name}")
-                
-                result = ingest_orchestrator.ingest_video(
-                    video_path=video_path,
-                    story_id=story_slug
-                )
-                
-                if result['success']:
-                    ingestion_jobs[job_id]['processed_files'] += 1
-                    ingestion_jobs[job_id]['total_shots'] += result['shots_stored']
-                    logger.info(f"[INGESTION] ✓ Processed {Path(video_path).name}: {result['shots_stored']} shots")
-                else:
-                    error_msg = f"Failed to process {Path(video_path).name}: {result.get('errors', ['Unknown error'])}"
-                    ingestion_jobs[job_id]['errors'].append(error_msg)
-                    logger.error(f"[INGESTION] ✗ {error_msg}")
-                
-                # Update progress
-                ingestion_jobs[job_id]['progress'] = int((i + 1) / len(video_paths) * 100)
-                
-            except Exception as e:
-                error_msg = f"Exception processing {Path(video_path).name}: {str(e)}"
+        def record_result(video_path: str, result: Dict[str, Any], done: int):
+            """Fold one video's outcome into the job record."""
+            if result['success']:
+                ingestion_jobs[job_id]['processed_files'] += 1
+                ingestion_jobs[job_id]['total_shots'] += result['shots_stored']
+                logger.info(f"[INGESTION] ✓ Processed {Path(video_path).name}: {result['shots_stored']} shots")
+            else:
+                error_msg = f"Failed to process {Path(video_path).name}: {result.get('errors', ['Unknown error'])}"
                 ingestion_jobs[job_id]['errors'].append(error_msg)
                 logger.error(f"[INGESTION] ✗ {error_msg}")
-                import traceback
-                logger.error(traceback.format_exc())
+
+            ingestion_jobs[job_id]['progress'] = int(done / len(video_paths) * 100)
+
+        max_workers = min(len(video_paths), os.cpu_count() or 1)
+
+        if max_workers > 1:
+            # Videos are independent ffmpeg + model work, so multi-file
+            # uploads run across worker processes; each worker builds
+            # its orchestrator once via the pool initializer
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_ingest_worker,
+                                     initargs=(config,)) as executor:
+                futures = {
+                    executor.submit(_ingest_video_in_worker, story_slug, video_path): video_path
+                    for video_path in video_paths
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    video_path = futures[future]
+                    try:
+                        record_result(video_path, future.result(), done)
+                    except Exception as e:
+                        error_msg = f"Exception processing {Path(video_path).name}: {str(e)}"
+                        ingestion_jobs[job_id]['errors'].append(error_msg)
+                        logger.error(f"[INGESTION] ✗ {error_msg}")
+                        import traceback
+                        logger.error(traceback.format_exc())
+        else:
+            # Single video: reuse the already-initialized orchestrator
+            for i, video_path in enumerate(video_paths):
+                try:
+                    logger.info(f"[INGESTION] Processing {i+1}/{len(video_paths)}: {Path(video_path).name}")
+
+                    result = ingest_orchestrator.ingest_video(
+                        video_path=video_path,
+                        story_id=story_slug
+                    )
+                    record_result(video_path, result, i + 1)
+
+                except Exception as e:
+                    error_msg = f"Exception processing {Path(video_path).name}: {str(e)}"
+                    ingestion_jobs[job_id]['errors'].append(error_msg)
+                    logger.error(f"[INGESTION] ✗ {error_msg}")
+                    import traceback
+                    logger.error(traceback.format_exc())
         
         # Mark as complete
         ingestion_jobs[job_id]['status'] = 'completed'
         ingestion_jobs[job_id]['end_time'] = datetime.now().isoformat()
+        # New shots make cached search and stats responses stale
+        query_cache.invalidate(story_slug=story_slug)
+        story_stats_cache.pop(story_slug, None)
         logger.info(f"[INGESTION] ✓ Job {job_id} completed: {ingestion_jobs[job_id]['total_shots']} shots from {ingestion_jobs[job_id]['processed_files']}/{len(video_paths)} files")
         
     except Exception as e:
@@ -698,11 +907,14 @@ async def upload_videos(
         video_paths = []
         
         for file in files:
-            # Save file
+            # Save file in 1 MB chunks; UploadFile.read is async and the
+            # disk writes go to the threadpool, so large uploads don't
+            # block the event loop the way shutil.copyfileobj did
             filename = file.filename or "unknown_file"
             file_path = upload_dir / filename
             with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+                while chunk := await file.read(1 << 20):
+                    await asyncio.to_thread(buffer.write, chunk)
             
             uploaded_files.append({
                 "filename": file.filename,
@@ -783,7 +995,12 @@ async def generate_edit(request: GenerateEditRequest, background_tasks: Backgrou
         
         # Default min verification score
         min_verification_score = 7.0
-        
+
+        # Listener registry for WebSocket clients; the compilation task
+        # runs in a worker thread and feeds them via this loop
+        loop = asyncio.get_running_loop()
+        compilation_listeners[job_id] = []
+
         # Trigger compilation in background
         background_tasks.add_task(
             run_compilation_task,
@@ -792,7 +1009,8 @@ async def generate_edit(request: GenerateEditRequest, background_tasks: Backgrou
             request.brief,
             request.target_duration,
             request.max_iterations,
-            min_verification_score
+            min_verification_score,
+            loop
         )
         
         logger.info(f"[API] Started compilation job {job_id}")
@@ -868,6 +1086,78 @@ async def get_compilation_status(job_id: str):
     return response
 
 
+@app.websocket("/ws/compilation/{job_id}")
+async def websocket_compilation_progress(websocket: WebSocket, job_id: str):
+    """
+    Stream real compilation progress for a job.
+
+    Updates are pushed by the compilation task's status callback, so
+    clients see beat-by-beat progress without polling the status
+    endpoint. Each connection gets its own queue so multiple clients
+    (or a reconnecting client) can follow the same job; clients that
+    arrive after the job has finished get the terminal state replayed
+    from the job record.
+    """
+    await websocket.accept()
+
+    job = compilation_jobs.get(job_id)
+    if job is None:
+        await websocket.send_json({
+            "type": "error",
+            "message": f"Compilation job {job_id} not found",
+            "timestamp": datetime.now().isoformat()
+        })
+        await websocket.close()
+        return
+
+    logger.info(f"[API] Compilation WebSocket connected for job {job_id}")
+
+    queue: Optional[asyncio.Queue] = None
+    try:
+        await websocket.send_json({
+            "type": "connected",
+            "job_id": job_id,
+            "timestamp": datetime.now().isoformat()
+        })
+
+        # Job already finished: replay terminal state instead of waiting
+        # on updates that will never come
+        if job["status"] in ("complete", "failed"):
+            if job["status"] == "complete":
+                await websocket.send_json({
+                    "type": "complete",
+                    "progress": job.get("progress", 100),
+                    "message": job.get("message", ""),
+                    "approved": (job.get("result") or {}).get("approved", False),
+                    "timestamp": datetime.now().isoformat()
+                })
+            else:
+                await websocket.send_json({
+                    "type": "failed",
+                    "message": job.get("error", ""),
+                    "timestamp": datetime.now().isoformat()
+                })
+            return
+
+        queue = asyncio.Queue()
+        compilation_listeners.setdefault(job_id, []).append(queue)
+
+        while True:
+            update = await queue.get()
+            await websocket.send_json(update)
+            if update.get("type") in ("complete", "failed"):
+                break
+
+    except WebSocketDisconnect:
+        logger.info(f"[API] Compilation WebSocket disconnected for job {job_id}")
+    finally:
+        if queue is not None:
+            listeners = compilation_listeners.get(job_id)
+            if listeners is not None and queue in listeners:
+                listeners.remove(queue)
+        await websocket.close()
+
+
 @app.websocket("/ws/edits/{job_id}")
 async def websocket_edit_progress(websocket: WebSocket, job_id: str):
     """
@@ -1006,8 +1296,8 @@ async def get_story_shots(story_slug: str):
         raise HTTPException(status_code=500, detail="Database not initialized")
     
     try:
-        shots = database.get_shots_by_story(story_slug)
-        
+        shots = await asyncio.to_thread(database.get_shots_by_story, story_slug)
+
         # Format for frontend
         formatted_shots = []
         for shot in shots:
@@ -6,6 +6,7 @@ Command-line interface for ingesting video rushes and compiling edits.
 """
 
 import argparse
+import logging
 import sys
 import json
 import yaml
@@ -242,6 +243,12 @@ def cmd_stats(args):
 
 def main():
     """Main CLI entry point."""
+    # Configure logging here rather than in library modules
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     parser = argparse.ArgumentParser(
         description="News Edit Agent - AI-powered video editing for news",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -40,29 +40,32 @@ class Embedder:
     def embed_text(self, texts: List[str]) -> np.ndarray:
         """
         Generate text embeddings.
-        
+
         Args:
             texts: List of text strings
-        
+
         Returns:
-            Numpy array of shape (len(texts), embedding_dim)
+            Numpy array of shape (len(texts), embedding_dim), unit-norm
+            rows (VectorIndex derives cosine scores from L2 distance,
+            which is only valid for normalized vectors)
         """
         if not texts:
             return np.array([])
-        
+
         self._load_text_model()
-        
+
         # Filter empty texts
         valid_texts = [t if t else " " for t in texts]
-        
+
         # Generate embeddings in batches
         embeddings = self.text_model.encode(
             valid_texts,
             batch_size=self.batch_size,
             show_progress_bar=False,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
-        
+
         return embeddings
     
     def embed_image(self, image_path: Path) -> np.ndarray:
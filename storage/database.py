@@ -3,7 +3,7 @@
 import sqlite3
 import pickle
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import numpy as np
 
@@ -15,7 +15,20 @@ class ShotsDatabase:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = None
+        self._change_listeners: List[Callable[[str], None]] = []
         self._init_db()
+
+    def add_change_listener(self, callback: Callable[[str], None]):
+        """
+        Register a callback invoked with the story_slug whenever shots
+        for that story change (used by callers to drop derived caches).
+        """
+        self._change_listeners.append(callback)
+
+    def _notify_change(self, story_slug: str):
+        """Tell registered listeners that a story's shots changed."""
+        for callback in self._change_listeners:
+            callback(story_slug)
     
     def _init_db(self):
         """Initialize database schema."""
@@ -144,8 +157,9 @@ class ShotsDatabase:
             shot_data.get('gemini_tone'),
             shot_data.get('gemini_confidence')
         ))
-        
+
         self.conn.commit()
+        self._notify_change(shot_data['story_slug'])
         return cursor.lastrowid
     
     def insert_edge(self, src_id: int, dst_id: int, edge_type: str, weight: float):
@@ -214,6 +228,34 @@ class ShotsDatabase:
         
         return shots
     
+    def get_story_stats(self, story_slug: str) -> Dict[str, Any]:
+        """
+        Aggregate shot statistics for a story inside SQLite.
+
+        One GROUP BY replaces fetching every row and tallying in
+        Python, so callers that only need counts and durations skip
+        the embedding deserialization entirely.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT COALESCE(shot_type, 'UNKNOWN') AS shot_type,
+                   COUNT(*) AS shot_count,
+                   SUM(duration_ms) AS total_duration_ms
+            FROM shots
+            WHERE story_slug = ?
+            GROUP BY COALESCE(shot_type, 'UNKNOWN')
+            """,
+            (story_slug,)
+        )
+        rows = cursor.fetchall()
+
+        return {
+            'total_shots': sum(row['shot_count'] for row in rows),
+            'total_duration_s': sum(row['total_duration_ms'] or 0 for row in rows) / 1000.0,
+            'shot_type_counts': {row['shot_type']: row['shot_count'] for row in rows},
+        }
+
     def get_shots_by_ids(self, shot_ids: List[int]) -> List[Dict[str, Any]]:
         """Retrieve multiple shots by their IDs."""
         if not shot_ids:
@@ -0,0 +1,141 @@
+"""
+Memory-mapped embedding store for cross-process reuse.
+
+Backs visual embeddings with a single np.memmap file plus a JSON
+shot_id -> row index, so repeated sequence-analysis calls (web workers,
+batch jobs) share the same OS page cache instead of rebuilding the
+embedding matrix from Python dicts per request.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingStore:
+    """Disk-backed store of L2-normalized float32 embeddings keyed by shot_id."""
+
+    def __init__(self, store_dir: str, dimension: int, capacity: int = 4096):
+        """
+        Initialize (or reopen) the store.
+
+        Args:
+            store_dir: Directory holding the memmap file and row index
+            dimension: Embedding dimension
+            capacity: Initial row capacity (grows by doubling)
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.store_dir / 'embeddings.f32'
+        self.index_path = self.store_dir / 'embeddings_index.json'
+        self.dimension = dimension
+
+        # shot_id -> row index (JSON keys are strings; normalize to int)
+        if self.index_path.exists():
+            with open(self.index_path, 'r') as f:
+                self._rows: Dict[int, int] = {
+                    int(k): v for k, v in json.load(f).items()
+                }
+        else:
+            self._rows = {}
+
+        self._count = len(self._rows)
+        self._capacity = max(capacity, self._count)
+
+        mode = 'r+' if self.data_path.exists() else 'w+'
+        self._mmap = np.memmap(
+            self.data_path,
+            dtype=np.float32,
+            mode=mode,
+            shape=(self._capacity, dimension)
+        )
+
+        logger.info("[EMBEDDING_STORE] Opened %s (%d embeddings, dim %d)",
+                    self.data_path, self._count, dimension)
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """The underlying (capacity, dimension) memmap array."""
+        return self._mmap
+
+    def row_for(self, shot_id: int) -> Optional[int]:
+        """Return the row index for a shot, or None if not stored."""
+        return self._rows.get(shot_id)
+
+    def get(self, shot_id: int) -> Optional[np.ndarray]:
+        """Return a zero-copy view of a shot's embedding, or None."""
+        row = self._rows.get(shot_id)
+        if row is None:
+            return None
+        return self._mmap[row]
+
+    def add(self, shot_id: int, vector: np.ndarray) -> int:
+        """
+        Store an embedding (normalized to unit length) and return its row.
+
+        Re-adding an existing shot_id overwrites its row in place.
+        """
+        v = np.asarray(vector, dtype=np.float32)
+        v = v / (np.linalg.norm(v) + 1e-8)
+
+        row = self._rows.get(shot_id)
+        if row is None:
+            if self._count >= self._capacity:
+                self._grow()
+            row = self._count
+            self._rows[shot_id] = row
+            self._count += 1
+
+        self._mmap[row] = v
+        return row
+
+    def flush(self):
+        """Flush the memmap and persist the row index."""
+        self._mmap.flush()
+        with open(self.index_path, 'w') as f:
+            json.dump({str(k): v for k, v in self._rows.items()}, f)
+
+    def take(self, shot_ids: List[int]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Fetch embeddings for the given shots from the mapped file.
+
+        Args:
+            shot_ids: Shot identifiers to look up
+
+        Returns:
+            (matrix, missing): rows for the found shots in request order,
+            and the list of shot_ids not present in the store
+        """
+        rows = []
+        missing = []
+        for shot_id in shot_ids:
+            row = self._rows.get(shot_id)
+            if row is None:
+                missing.append(shot_id)
+            else:
+                rows.append(row)
+        return self._mmap[rows], missing
+
+    def _grow(self):
+        """Double capacity, preserving existing rows."""
+        new_capacity = self._capacity * 2
+        self._mmap.flush()
+        old = np.array(self._mmap[:self._count])
+        self._mmap = np.memmap(
+            self.data_path,
+            dtype=np.float32,
+            mode='r+' if self.data_path.stat().st_size >= new_capacity * self.dimension * 4 else 'w+',
+            shape=(new_capacity, self.dimension)
+        )
+        self._mmap[:self._count] = old
+        self._capacity = new_capacity
+        logger.info("[EMBEDDING_STORE] Grew capacity to %d rows", new_capacity)
+
+    def size(self) -> int:
+        """Return number of stored embeddings."""
+        return self._count
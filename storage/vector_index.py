@@ -17,19 +17,29 @@ class SearchResult:
 class VectorIndex:
     """FAISS HNSW index for fast similarity search."""
     
-    def __init__(self, dimension: int, m: int = 32, ef_construction: int = 200):
+    def __init__(self, dimension: int, m: int = 32, ef_construction: int = 200,
+                 quantize_int8: bool = False):
         """
         Initialize HNSW index.
-        
+
         Args:
             dimension: Vector dimension
             m: HNSW parameter (number of connections)
             ef_construction: HNSW construction parameter
+            quantize_int8: Store vectors scalar-quantized to int8 instead
+                of float32. Searches read 4x fewer bytes per vector at a
+                small recall cost; queries stay float32 and dequantization
+                happens inside FAISS.
         """
         self.dimension = dimension
-        self.index = faiss.IndexHNSWFlat(dimension, m)
+        self.quantize_int8 = quantize_int8
+        if quantize_int8:
+            self.index = faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_8bit, m)
+        else:
+            self.index = faiss.IndexHNSWFlat(dimension, m)
         self.index.hnsw.efConstruction = ef_construction
         self.shot_ids: List[int] = []
+        self._id_positions: Dict[int, int] = {}
         self.is_trained = False
     
     def add(self, shot_ids: List[int], vectors: np.ndarray):
@@ -45,54 +55,108 @@ class VectorIndex:
         
         # Ensure float32
         vectors = vectors.astype('float32')
-        
+
+        # Scalar quantizer needs per-dimension ranges before encoding
+        if not self.index.is_trained:
+            self.index.train(vectors)
+
         # Add to index
         self.index.add(vectors)
+        for i, shot_id in enumerate(shot_ids, start=len(self.shot_ids)):
+            self._id_positions[shot_id] = i
         self.shot_ids.extend(shot_ids)
         self.is_trained = True
     
-    def search(self, query_vector: np.ndarray, k: int = 10, ef_search: int = 100) -> List[SearchResult]:
+    def search(self, query_vector: np.ndarray, k: int = 10, ef_search: int = 100,
+               allowed_ids: Optional[List[int]] = None) -> List[SearchResult]:
         """
         Search for k nearest neighbors.
-        
+
         Args:
             query_vector: Query vector of shape (dimension,) or (1, dimension)
             k: Number of results to return
             ef_search: HNSW search parameter (higher = more accurate but slower)
-        
+            allowed_ids: Optional shot IDs to restrict the search to;
+                filtering happens inside the index walk, so no results
+                are wasted on out-of-scope shots
+
         Returns:
             List of SearchResult objects
         """
-        if not self.is_trained or len(self.shot_ids) == 0:
-            return []
-        
-        # Reshape if needed
         if query_vector.ndim == 1:
             query_vector = query_vector.reshape(1, -1)
-        
-        # Ensure float32
-        query_vector = query_vector.astype('float32')
-        
+        return self.search_batch(query_vector, k=k, ef_search=ef_search,
+                                 allowed_ids=allowed_ids)[0]
+
+    def search_batch(self,
+                     query_matrix: np.ndarray,
+                     k: int = 10,
+                     ef_search: int = 100,
+                     allowed_ids: Optional[List[int]] = None) -> List[List[SearchResult]]:
+        """
+        Search k nearest neighbors for many queries in one call.
+
+        FAISS walks the index for all rows of the batch inside a single
+        C++ call, so Q queries touch the index structure in one pass
+        instead of Q Python-dispatched searches.
+
+        Args:
+            query_matrix: Query vectors of shape (Q, dimension)
+            k: Number of results per query
+            ef_search: HNSW search parameter (higher = more accurate but slower)
+            allowed_ids: Optional shot IDs to restrict the search to
+
+        Returns:
+            One list of SearchResult objects per query row
+        """
+        if query_matrix.ndim == 1:
+            query_matrix = query_matrix.reshape(1, -1)
+
+        if not self.is_trained or len(self.shot_ids) == 0:
+            return [[] for _ in range(query_matrix.shape[0])]
+
+        # Ensure contiguous float32
+        query_matrix = np.ascontiguousarray(query_matrix, dtype='float32')
+
         # Set search parameter
         self.index.hnsw.efSearch = ef_search
-        
-        # Search
+
+        # Search all rows at once
         k = min(k, len(self.shot_ids))
-        distances, indices = self.index.search(query_vector, k)
-        
+        if allowed_ids is not None:
+            positions = np.fromiter(
+                (self._id_positions[shot_id] for shot_id in allowed_ids
+                 if shot_id in self._id_positions),
+                dtype='int64'
+            )
+            if positions.size == 0:
+                return [[] for _ in range(query_matrix.shape[0])]
+            params = faiss.SearchParametersHNSW(
+                sel=faiss.IDSelectorBatch(positions),
+                efSearch=ef_search
+            )
+            distances, indices = self.index.search(
+                query_matrix, min(k, positions.size), params=params
+            )
+        else:
+            distances, indices = self.index.search(query_matrix, k)
+
         # Convert to results
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx >= 0 and idx < len(self.shot_ids):
-                # Convert distance to similarity score (cosine similarity)
-                score = 1.0 - (dist / 2.0)  # HNSW uses L2 distance
-                results.append(SearchResult(
-                    shot_id=self.shot_ids[idx],
-                    score=float(score),
-                    distance=float(dist)
-                ))
-        
-        return results
+        batched = []
+        for dist_row, idx_row in zip(distances, indices):
+            results = []
+            for dist, idx in zip(dist_row, idx_row):
+                if idx >= 0 and idx < len(self.shot_ids):
+                    # Convert distance to similarity score (cosine similarity)
+                    score = 1.0 - (dist / 2.0)  # HNSW uses L2 distance
+                    results.append(SearchResult(
+                        shot_id=self.shot_ids[idx],
+                        score=float(score),
+                        distance=float(dist)
+                    ))
+            batched.append(results)
+
+        return batched
     
     def size(self) -> int:
         """Return number of vectors in index."""
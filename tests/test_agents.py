@@ -70,3 +70,44 @@ class TestVerifierAgent:
         """Test edit verification."""
         # Skip this test for now - requires full integration
         pytest.skip("Requires full agent integration")
+
+
+class TestSystemPrompts:
+    """Tests for system prompt stability."""
+
+    def test_prompt_identity_stable(self):
+        """get_system_prompt must return the canonical module constants."""
+        from agent import system_prompts
+
+        assert system_prompts.get_system_prompt('picker') is \
+            system_prompts.PICKER_SYSTEM_PROMPT
+        assert system_prompts.get_system_prompt('verifier') is \
+            system_prompts.VERIFIER_SYSTEM_PROMPT
+        # Unknown roles fall back to the agent prompt
+        assert system_prompts.get_system_prompt('unknown') is \
+            system_prompts.AGENT_SYSTEM_PROMPT
+
+    def test_prompt_reimport_stable(self):
+        """Re-importing the module must not reallocate prompt strings."""
+        import importlib
+        from agent import system_prompts
+
+        before = system_prompts.PICKER_SYSTEM_PROMPT
+        reimported = importlib.import_module('agent.system_prompts')
+        assert reimported.PICKER_SYSTEM_PROMPT is before
+
+    def test_prompts_static_contract(self):
+        """Prompts must stay free of templating and hash-stable on reload."""
+        import importlib
+        from agent import system_prompts as sp
+
+        assert sp.SYSTEM_PROMPT_IS_STATIC
+        for role in ('agent', 'planner', 'picker', 'verifier'):
+            prompt = sp.get_system_prompt(role)
+            assert '.format(' not in prompt
+            # No templating in the cache-critical prefix
+            assert '{' not in prompt[:1024]
+
+        digests_before = dict(sp.SYSTEM_PROMPT_SHA256)
+        reloaded = importlib.reload(sp)
+        assert dict(reloaded.SYSTEM_PROMPT_SHA256) == digests_before